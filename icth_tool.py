@@ -5,6 +5,9 @@ Dieses Tool enthält nützliche Funktionen für die ICTh-Prüfung.
 
 import math
 
+from tools_entropy_compression import RLETool
+from tools_channel_coding import GF2Kernel
+
 # Globale Variablen für Rückkehr zum Hauptmenü
 main_menu_active = True
 current_menu = "main"
@@ -72,36 +75,13 @@ def huffman_coding(symbols, frequencies):
 
 def rle_encode(data):
     """Komprimiert Bitfolgen mit Lauflängenkodierung"""
-    if not data:
-        return ""
-
-    encoding = ""
-    prev_char = data[0]
-    count = 1
-
-    for char in data[1:]:
-        if char == prev_char:
-            count += 1
-        else:
-            encoding += str(count)
-            prev_char = char
-            count = 1
-
-    encoding += str(count)
-    return encoding
+    return "".join(str(count) for _, count in RLETool().rle_iter_runs([data]))
 
 
 def rle_decode(data, start_with="1"):
     """Dekomprimiert RLE-Daten zurück in Binärformat"""
-    result = ""
-    current_char = start_with
-
-    for count in data:
-        result += current_char * int(count)
-        # Wechsle zwischen '0' und '1'
-        current_char = '1' if current_char == '0' else '0'
-
-    return result
+    lengths = (int(count) for count in data)
+    return "".join(RLETool().rle_iter_bit_decode(lengths, int(start_with), packed=False))
 
 
 def lzw_encode(data, initial_dict=None):
@@ -566,22 +546,10 @@ def syndrome(received, parity_matrix):
 
 
 def mod2div(dividend, divisor):
-    """Durchführung der Polynomdivision im GF(2)"""
-    # Kopiere die Bits des Dividenden
-    result = list(dividend)
-
-    # Anzahl der Bits, die verarbeitet werden sollen
-    pick_len = len(divisor)
-
-    # Durchlaufe bis zur Ende des Dividenden
-    for i in range(len(dividend) - pick_len + 1):
-        if result[i] == '1':
-            # XOR-Operation mit dem Divisor
-            for j in range(pick_len):
-                result[i + j] = str(int(result[i + j]) ^ int(divisor[j]))
-
-    # Der Rest ist das Fehlersyndrom
-    return ''.join(result[-(pick_len - 1):])
+    """Durchführung der Polynomdivision im GF(2), Rest mit len(divisor) - 1 Stellen"""
+    kernel = GF2Kernel()
+    remainder = kernel.mod(kernel.from_bits(dividend), kernel.from_bits(divisor))
+    return kernel.to_bits(remainder, len(divisor) - 1)
 
 
 def crc_check(message, generator, n_check_bits):
@@ -1780,27 +1748,102 @@ def polynomial_menu():
 # Quellen mit Gedächtnis #
 #####################
 
-def compute_stationary_distribution(transition_matrix):
+def transition_rows(transition):
     """
-    Berechnet näherungsweise die stationäre Verteilung einer Markov-Kette
-    Verwendet Potenzmethode statt Matrixinversion (MicroPython-kompatibel)
+    Bringt eine Übergangsmatrix in die Form [(Spalten, Werte), ...] pro Zeile.
+    Akzeptiert eine dichte Liste von Listen, Zeilen als dict {Spalte: p}
+    oder ein CSR-Tupel (indptr, indices, data).
+    """
+    if isinstance(transition, tuple):
+        indptr, indices, data = transition
+        return [(list(indices[indptr[i]:indptr[i + 1]]), list(data[indptr[i]:indptr[i + 1]]))
+                for i in range(len(indptr) - 1)]
+
+    rows = []
+    for row in transition:
+        if isinstance(row, dict):
+            items = [(j, p) for j, p in row.items() if p]
+        else:
+            items = [(j, p) for j, p in enumerate(row) if p]
+        rows.append(([j for j, _ in items], [p for _, p in items]))
+    return rows
+
+
+def left_multiply(pi, rows):
+    """Berechnet pi * P für P in Zeilenform"""
+    result = [0.0] * len(rows)
+    for i in range(len(rows)):
+        weight = pi[i]
+        if weight:
+            cols, vals = rows[i]
+            for k in range(len(cols)):
+                result[cols[k]] += weight * vals[k]
+    return result
+
+
+def stationary_distribution(transition, tol=1e-12, max_iter=10000, method="power"):
+    """
+    Stationäre Verteilung einer Markov-Kette, iteriert bis das Residuum
+    ||pi*P - pi||_1 unter tol liegt. method "power" ist die Potenzmethode,
+    "gauss_seidel" löst pi_j = sum_i pi_i*P_ij mit jeweils schon
+    aktualisierten Werten (konvergiert meist in weniger Durchläufen).
+    Gibt Verteilung, Anzahl Iterationen und Residuum zurück.
     """
-    n = len(transition_matrix)
-    # Starte mit Gleichverteilung
+    rows = transition_rows(transition)
+    n = len(rows)
     pi = [1.0 / n] * n
 
-    # Iteration der Potenzmethode
-    for _ in range(50):  # 50 Iterationen für Konvergenz
-        new_pi = [0] * n
-        for j in range(n):
-            for i in range(n):
-                new_pi[j] += pi[i] * transition_matrix[i][j]
+    if method == "gauss_seidel":
+        # Eingehende Übergänge pro Zustand und Diagonale
+        incoming = [([], []) for _ in range(n)]
+        diag = [0.0] * n
+        for i in range(n):
+            cols, vals = rows[i]
+            for k in range(len(cols)):
+                j = cols[k]
+                if j == i:
+                    diag[j] += vals[k]
+                else:
+                    incoming[j][0].append(i)
+                    incoming[j][1].append(vals[k])
+    elif method != "power":
+        raise ValueError("Unbekannte Methode: " + str(method))
+
+    iterations = 0
+    residual = float("inf")
+    while iterations < max_iter:
+        iterations += 1
+        if method == "power":
+            new_pi = left_multiply(pi, rows)
+            total = sum(new_pi)
+            new_pi = [p / total for p in new_pi]
+            residual = sum(abs(a - b) for a, b in zip(new_pi, pi))
+            pi = new_pi
+        else:
+            for j in range(n):
+                sources, vals = incoming[j]
+                acc = 0.0
+                for k in range(len(sources)):
+                    acc += pi[sources[k]] * vals[k]
+                stay = 1.0 - diag[j]
+                if stay > 0:
+                    pi[j] = acc / stay
+            total = sum(pi)
+            pi = [p / total for p in pi]
+            residual = sum(abs(a - b) for a, b in zip(left_multiply(pi, rows), pi))
+
+        if residual < tol:
+            break
+
+    return {"distribution": pi, "iterations": iterations, "residual": residual}
 
-        # Normalisiere
-        total = sum(new_pi)
-        pi = [p / total for p in new_pi]
 
-    return pi
+def compute_stationary_distribution(transition_matrix, tol=1e-12, max_iter=10000):
+    """
+    Berechnet die stationäre Verteilung einer Markov-Kette
+    Verwendet Potenzmethode statt Matrixinversion (MicroPython-kompatibel)
+    """
+    return stationary_distribution(transition_matrix, tol, max_iter)["distribution"]
 
 
 def joint_probability(px, pyx):
@@ -1855,19 +1898,22 @@ def conditional_entropy_yx(pxy, px):
     return h_yx
 
 
-def entropy_with_memory(transition_matrix):
+def entropy_with_memory(transition_matrix, method="power"):
     """
     Berechnet die Entropie einer Quelle mit Gedächtnis (Markov-Quelle)
     """
     # Berechne stationäre Verteilung
-    pi = compute_stationary_distribution(transition_matrix)
+    solution = stationary_distribution(transition_matrix, method=method)
+    pi = solution["distribution"]
+    rows = transition_rows(transition_matrix)
 
     # Berechne bedingte Entropie H(X_t+1 | X_t)
     h_cond = 0.0
     for i in range(len(pi)):
-        for j in range(len(transition_matrix[i])):
-            if pi[i] > 0 and transition_matrix[i][j] > 0:
-                h_cond -= pi[i] * transition_matrix[i][j] * math.log2(transition_matrix[i][j])
+        if pi[i] > 0:
+            for p in rows[i][1]:
+                if p > 0:
+                    h_cond -= pi[i] * p * math.log2(p)
 
     # Berechne Entropie der stationären Verteilung H(X)
     h_stationary = 0.0
@@ -1879,10 +1925,94 @@ def entropy_with_memory(transition_matrix):
         "stationary_distribution": pi,
         "conditional_entropy": h_cond,
         "stationary_entropy": h_stationary,
-        "entropy_rate": h_cond
+        "entropy_rate": h_cond,
+        "iterations": solution["iterations"],
+        "residual": solution["residual"]
     }
 
 
+def entropy_from_counts(counts, total):
+    """Entropie in Bits aus absoluten Häufigkeiten"""
+    if total == 0:
+        return 0.0
+    s = 0.0
+    for c in counts:
+        s += c * math.log2(c)
+    return math.log2(total) - s / total
+
+
+def ngram_counts(data, order, symbol_bits=None):
+    """
+    Zählt alle n-Gramme der Länge order in einem Durchlauf. Jedes n-Gramm
+    wird als Ganzzahl (symbol_bits Bits pro Symbol) kodiert.
+    Gibt (Zähler, Anzahl Symbole, Code der letzten order-1 Symbole) zurück.
+    """
+    if isinstance(data, str):
+        values = [ord(c) for c in data]
+    else:
+        values = data
+    if symbol_bits is None:
+        if isinstance(values, (bytes, bytearray)):
+            symbol_bits = 8
+        else:
+            largest = max(values) if len(values) else 0
+            symbol_bits = 1
+            while largest >> symbol_bits:
+                symbol_bits += 1
+
+    mask = (1 << (symbol_bits * order)) - 1
+    counts = {}
+    code = 0
+    n = 0
+    warmup = order - 1
+    for value in values:
+        code = ((code << symbol_bits) | value) & mask
+        if n >= warmup:
+            counts[code] = counts.get(code, 0) + 1
+        n += 1
+    tail = code & ((1 << (symbol_bits * (order - 1))) - 1)
+    return counts, n, tail, symbol_bits
+
+
+def block_entropies(data, max_order, symbol_bits=None):
+    """
+    Schätzt aus einer Symbolfolge die Blockentropien H_k (Entropie der
+    k-Gramme) und die bedingten Entropien H(X_n | X_n-k..X_n-1) = H_k+1 - H_k
+    für k = 1..max_order. Gezählt werden nur die (max_order+1)-Gramme, die
+    Häufigkeiten kürzerer Blöcke folgen durch Abschneiden der Codes.
+    """
+    m = max_order + 1
+    counts, n, tail, bits = ngram_counts(data, m, symbol_bits)
+
+    entropies = [0.0]
+    for k in range(1, m + 1):
+        if k == m:
+            counts_k = counts
+        else:
+            counts_k = {}
+            shift = bits * (m - k)
+            for code, c in counts.items():
+                prefix = code >> shift
+                counts_k[prefix] = counts_k.get(prefix, 0) + c
+            # k-Gramme in den letzten m-1 Symbolen sind in keinem m-Gramm der Anfang
+            tail_len = min(n, m - 1)
+            mask_k = (1 << (bits * k)) - 1
+            for j in range(tail_len - k + 1):
+                prefix = (tail >> (bits * (tail_len - k - j))) & mask_k
+                counts_k[prefix] = counts_k.get(prefix, 0) + 1
+        entropies.append(entropy_from_counts(counts_k.values(), max(n - k + 1, 0)))
+
+    result = []
+    for k in range(1, m):
+        result.append({
+            "order": k,
+            "block_entropy": entropies[k],
+            "per_symbol": entropies[k] / k,
+            "conditional_entropy": entropies[k + 1] - entropies[k],
+        })
+    return result
+
+
 #####################
 # Menü-Funktionen #
 #####################
@@ -1897,6 +2027,7 @@ def markov_menu():
         print("1. Verbundwahrscheinlichkeiten berechnen")
         print("2. Bedingte Entropie berechnen")
         print("3. Entropie für Quellen mit Gedächtnis")
+        print("4. Entropie aus Symbolfolge schätzen")
         print("0. Zurück zum Hauptmenü")
 
         choice = input("\nWähle eine Option: ")
@@ -2003,6 +2134,23 @@ def markov_menu():
                 print(f"\nStationäre Entropie H(X) = {result['stationary_entropy']:.6f} bits")
                 print(f"Bedingte Entropie H(X_t+1|X_t) = {result['conditional_entropy']:.6f} bits")
                 print(f"Entropierate = {result['entropy_rate']:.6f} bits pro Symbol")
+                print(f"Iterationen: {result['iterations']}, Residuum: {result['residual']:.2e}")
+            except Exception as e:
+                print(f"Fehler: {str(e)}")
+            pause()
+
+        elif choice == "4":
+            # Blockentropien aus einer Symbolfolge
+            clear_screen()
+            print("==== Entropie aus Symbolfolge ====")
+            try:
+                data = input("Symbolfolge: ").strip()
+                max_order = int(input("Maximale Ordnung K: "))
+
+                print("\nk   H_k        H_k/k      H(X|k Vorgänger)")
+                for row in block_entropies(data, max_order):
+                    print(f"{row['order']:<3} {row['block_entropy']:<10.6f} {row['per_symbol']:<10.6f} "
+                          f"{row['conditional_entropy']:.6f}")
             except Exception as e:
                 print(f"Fehler: {str(e)}")
             pause()
@@ -2094,39 +2242,13 @@ def polynomial_division_gf2(dividend, divisor):
     Rückgabe:
         (quotient, remainder): Tupel mit Ergebnispolynomen
     """
-    # Entferne führende Nullen
-    while len(dividend) > 0 and dividend[0] == 0:
-        dividend = dividend[1:]
-    while len(divisor) > 0 and divisor[0] == 0:
-        divisor = divisor[1:]
-
-    if not divisor:
+    kernel = GF2Kernel()
+    divisor_poly = kernel.from_bits(divisor)
+    if not divisor_poly:
         raise ValueError("Division durch Null")
 
-    if not dividend:
-        return [0], [0]
-
-    if len(dividend) < len(divisor):
-        return [0], dividend.copy()
-
-    quotient = [0] * (len(dividend) - len(divisor) + 1)
-    remainder = dividend.copy()
-
-    for i in range(len(quotient)):
-        if remainder[i] == 1:
-            quotient[i] = 1
-            for j in range(len(divisor)):
-                remainder[i + j] = (remainder[i + j] + divisor[j]) % 2
-
-    # Entferne führende Nullen im Rest
-    while len(remainder) > 0 and remainder[0] == 0:
-        remainder = remainder[1:]
-
-    # Falls Rest leer ist, setze ihn auf [0]
-    if not remainder:
-        remainder = [0]
-
-    return quotient, remainder
+    quotient, remainder = kernel.divide(kernel.from_bits(dividend), divisor_poly)
+    return kernel.to_vector(quotient), kernel.to_vector(remainder)
 
 
 def is_irreducible_polynomial(poly):
@@ -16,6 +16,16 @@ TOOLS = [
         tool_base.ToolEntry(4, "Lauflängenkodierung (RLE)", tools_entropy_compression.RLETool),
         tool_base.ToolEntry(5, "Lempel-Ziv LZW", tools_entropy_compression.LZW),
         tool_base.ToolEntry(6, "Vollständige Analyse", tools_entropy_compression.InfoAnalyseTool),
+        tool_base.ToolEntry(7, "Datei-Entropie", tools_entropy_compression.FileEntropyTool),
+        tool_base.ToolEntry(8, "Range Coder (arithmetisch)", tools_entropy_compression.RangeCoderTool),
+        tool_base.ToolEntry(9, "Adaptiver Huffman", tools_entropy_compression.AdaptiveHuffmanTool),
+        tool_base.ToolEntry(10, "Lempel-Ziv LZSS", tools_entropy_compression.LZSS),
+        tool_base.ToolEntry(11, "Burrows-Wheeler (BWT + MTF + RLE + Huffman)", tools_entropy_compression.BWTTool),
+        tool_base.ToolEntry(12, "Huffman für Quellenerweiterung", tools_entropy_compression.HuffmanExtensionTool),
+        tool_base.ToolEntry(13, "Präfixcode prüfen (Kraft)", tools_entropy_compression.PrefixCodeTool),
+        tool_base.ToolEntry(14, "Shannon-Fano / Shannon-Fano-Elias", tools_entropy_compression.ShannonFanoTool),
+        tool_base.ToolEntry(15, "Tunstall-Code", tools_entropy_compression.TunstallTool),
+        tool_base.ToolEntry(16, "LZ78 / LZ-Komplexität", tools_entropy_compression.LZ78),
     ]),
 
     tool_base.ToolEntry(2, "RSA", tools_rsa.RSA),
@@ -30,6 +40,7 @@ TOOLS = [
         tool_base.ToolEntry(7, "Polynomdivision", tools_channel_coding.PolynomialDivisionTool),
         tool_base.ToolEntry(8, "Hamming-Distanz berechnen", tools_channel_coding.HammingDistanceTool),
         tool_base.ToolEntry(9, "Code-Parameter & Dichtgepacktheit", tools_channel_coding.CodeParametersAndBoundsTool),
+        tool_base.ToolEntry(10, "CRC: Datei parallel / Benchmark", tools_channel_coding.CRCParallelTool),
         # Neuer/Angepasster Eintrag
 
     ]),
@@ -1,7 +1,16 @@
+import os
 import sys
 
 import menu
 import tool_base
+import tools_channel_coding
+import tools_entropy_compression
+
+try:
+    import tempfile
+except ImportError:
+    # MicroPython: kein tempfile, Testdateien im aktuellen Verzeichnis
+    tempfile = None
 
 REGENERATE_REFERENCES = False
 
@@ -10,6 +19,20 @@ def _get_test_functions():
     return [obj for name, obj in globals().items() if callable(obj) and name.startswith("test_")]
 
 
+def _tmp_path(name):
+    if tempfile is None:
+        return name
+    return os.path.join(tempfile.gettempdir(), name)
+
+
+def _remove(*paths):
+    for path in paths:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
 def test_a():
     print("test_a")
 
@@ -37,6 +60,481 @@ def test_tools():
     check_tool_list(menu.TOOLS, "")
 
 
+def test_huffman_canonical():
+    tool = tools_entropy_compression.HuffmanTool()
+    code = tool.huffman_coding(["A", "B", "C", "D"], [0.5, 0.25, 0.125, 0.125])
+    assert code == [("A", "0"), ("B", "10"), ("C", "110"), ("D", "111")]
+    assert tool.huffman_coding(["X"], [1.0]) == [("X", "0")]
+
+
+def test_huffman_large_alphabet():
+    tool = tools_entropy_compression.HuffmanTool()
+    freqs = [(i * 7919) % 1000 + 1 for i in range(4096)]
+    lengths = tool.huffman_code_lengths(freqs)
+    kraft = sum(2.0 ** -l for l in lengths)
+    assert abs(kraft - 1.0) < 1e-9
+    codes = sorted(tool.canonical_codes(lengths))
+    for i in range(len(codes) - 1):
+        assert not codes[i + 1].startswith(codes[i])
+
+
+def test_huffman_bit_codec_roundtrip():
+    tool = tools_entropy_compression.HuffmanTool()
+    symbols = ["a", "b", "c", "d", "e"]
+    codes = dict(tool.huffman_coding(symbols, [40, 30, 15, 10, 5]))
+    msg = "abacabadabacabae" * 50
+    packed, n_bits = tool.encode_bits(msg, codes)
+    assert n_bits == sum(len(codes[c]) for c in msg)
+    assert len(packed) == (n_bits + 7) // 8
+    for table_bits in (1, 3, 8):
+        assert "".join(tool.decode_bits(packed, n_bits, codes, table_bits)) == msg
+    assert tool.bits_to_string(packed, n_bits) == "".join(codes[c] for c in msg)
+
+
+def test_huffman_length_limited():
+    tool = tools_entropy_compression.HuffmanTool()
+    freqs = [2 ** -i for i in range(1, 20)]
+    lengths = tool.limited_code_lengths(freqs, 6)
+    assert max(lengths) == 6
+    assert sum(2.0 ** -l for l in lengths) <= 1.0
+    report = tool.length_limit_report(freqs, [6, 19])
+    assert report[0]['penalty'] > 0
+    assert abs(report[1]['penalty']) < 1e-9
+    assert report[0]['table_entries'] == 64
+
+
+def test_lzw_encode_trie():
+    tool = tools_entropy_compression.LZW()
+    result, dictionary = tool.lzw_encode("ABABABA", ["A", "B"])
+    assert result == [0, 1, 2, 4]
+    assert dictionary == {"A": 0, "B": 1, "AB": 2, "BA": 3, "ABA": 4}
+    result, dictionary = tool.lzw_encode("xyxy", {"x": 5, "y": 9})
+    assert result == [5, 9, 2]
+    assert dictionary["xy"] == 2
+    result, dictionary = tool.lzw_encode(b"aaaa")
+    assert result == [0, 1, 0]
+    assert dictionary[b"aa"] == 1
+    # 'A' ist nur Präfix von 'AB': Fehler erst, wenn 'A' allein ausgegeben werden müsste
+    assert tool.lzw_encode("XAB", {"X": 0, "AB": 1})[0] == [0, 1]
+    for data in ("XAC", "XA"):
+        try:
+            tool.lzw_encode(data, {"X": 0, "AB": 1})
+            assert False
+        except ValueError:
+            pass
+
+
+def test_lzw_decode_table():
+    tool = tools_entropy_compression.LZW()
+    assert tool.lzw_decode([0, 1, 2, 4], ["A", "B"]) == "ABABABA"
+    assert tool.lzw_decode([1, 2, 10], None) == "1212"
+    data = "abababcabcabcabcd" * 20
+    codes, _ = tool.lzw_encode(data, list("abcd"))
+    assert tool.lzw_decode(codes, list("abcd")) == data
+    chunks = list(tool.lzw_decode_stream(codes, list("abcd"), chunk_size=16))
+    assert "".join(chunks) == data
+    assert max(len(c) for c in chunks) <= 16
+    codes, _ = tool.lzw_encode(b"xyxyxyxy", list(range(256)))
+    assert tool.lzw_decode(codes, list(range(256)), as_bytes=True) == b"xyxyxyxy"
+
+
+def test_lzw_bounded_policies():
+    tool = tools_entropy_compression.LZW()
+    seed = 1
+    chars = []
+    for _ in range(6000):
+        seed = (seed * 1103515245 + 12345) % 2147483648
+        chars.append("abc"[(seed >> 16) % 3])
+    data = "".join(chars)
+    for policy in tool.POLICIES:
+        codes, stats = tool.lzw_encode_bounded(data, list("abc"), 9, policy)
+        assert max(codes) < 512
+        assert stats['peak_entries'] <= 512
+        assert tool.lzw_decode_bounded(codes, list("abc"), 9, policy) == data
+    report = tool.lzw_policy_report(data, list("abc"), 9)
+    assert [r['policy'] for r in report] == list(tool.POLICIES)
+    assert report[1]['resets'] > 0
+    assert report[2]['evictions'] > 0
+
+
+def test_lzw_file_container():
+    tool = tools_entropy_compression.LZW()
+    data = b"".join(bytes([65 + (i * i) % 7]) for i in range(20000))
+    in_path = _tmp_path("test_lzw.in.tmp")
+    lzw_path = _tmp_path("test_lzw.lzw.tmp")
+    out_path = _tmp_path("test_lzw.out.tmp")
+    try:
+        with open(in_path, "wb") as f:
+            f.write(data)
+        for policy in tool.POLICIES:
+            stats = tool.lzw_compress_file(in_path, lzw_path, 9, policy, chunk_size=1000)
+            assert stats['in_bytes'] == len(data)
+            assert stats['out_bytes'] < len(data)
+            tool.lzw_decompress_file(lzw_path, out_path, chunk_size=1000)
+            with open(out_path, "rb") as f:
+                assert f.read() == data
+    finally:
+        _remove(in_path, lzw_path, out_path)
+
+
+def test_rle_engine():
+    tool = tools_entropy_compression.RLETool()
+    assert tool.rle_encode("aaabcc") == ([("a", 3), ("b", 1), ("c", 2)], 3)
+    data = b"\x00" * 100 + b"\x07" * 3 + b"\xff" * 40
+    for form in (data, bytearray(data), memoryview(data)):
+        assert tool.rle_encode(form)[0] == [(0, 100), (7, 3), (255, 40)]
+    chunks = [data[i:i + 7] for i in range(0, len(data), 7)]
+    assert list(tool.rle_iter_runs(chunks)) == [(0, 100), (7, 3), (255, 40)]
+    assert tool.rle_decode(tool.rle_encode(data)[0]) == data
+    assert tool.rle_decode(tool.rle_encode("aaabcc")[0]) == "aaabcc"
+    assert tool.rle_encode([1, 1, 2]) == ([(1, 2), (2, 1)], 2)
+    assert list(tool.rle_iter_runs([(1, 1), [1, 2]])) == [(1, 3), (2, 1)]
+
+
+def test_rle_bit_runs():
+    tool = tools_entropy_compression.RLETool()
+    data = b"\x00" * 100 + b"\x07" * 3 + b"\xff" * 40
+    lengths = list(tool.rle_iter_bit_runs([data]))
+    assert lengths[:3] == [805, 3, 5]
+    assert b"".join(tool.rle_iter_bit_decode(lengths, chunk_size=8)) == data
+    assert list(tool.rle_iter_bit_runs(["1100010"])) == [0, 2, 3, 1, 1]
+    assert "".join(tool.rle_iter_bit_decode([3, 2, 1, 1], 1, packed=False)) == "1110010"
+
+
+def test_file_entropy():
+    tool = tools_entropy_compression.FileEntropyTool()
+    path = _tmp_path("test_entropy.tmp")
+    try:
+        with open(path, "wb") as f:
+            f.write(b"AAAABBCD" * 1000)
+        report = tool.file_entropy(path, chunk_size=100)
+    finally:
+        _remove(path)
+    assert report['bytes'] == 8000
+    assert report['distinct'] == 4
+    assert abs(report['entropy'] - 1.75) < 1e-9
+    assert abs(report['redundanz'] - 6.25) < 1e-9
+    assert abs(report['huffman_avg'] - 1.75) < 1e-9
+
+
+def test_entropy_profile():
+    tool = tools_entropy_compression.FileEntropyTool()
+    data = b"\x00" * 64 + bytes(range(64)) + b"AB" * 32
+    chunks = [data[i:i + 10] for i in range(0, len(data), 10)]
+    profile = list(tool.iter_entropy_profile(chunks, 64, 32))
+    assert [offset for offset, _ in profile] == [0, 32, 64, 96, 128]
+    assert abs(profile[0][1]) < 1e-9
+    assert abs(profile[2][1] - 6.0) < 1e-9
+    assert abs(profile[4][1] - 1.0) < 1e-9
+
+
+def test_range_coder():
+    tool = tools_entropy_compression.RangeCoderTool()
+    freqs = tool.quantize([0.5, 0.25, 0.125, 0.125])
+    assert freqs == [2048, 1024, 512, 512]
+    assert tool.quantize([1e-9, 1.0], 8) == [1, 255]
+    state = 12345
+    message = []
+    for _ in range(3000):
+        state = (state * 1103515245 + 12345) & 0x7FFFFFFF
+        message.append((state >> 16) % 4)
+    encoded = tool.range_encode(message, freqs)
+    assert tool.range_decode(encoded, len(message), freqs) == message
+    assert tool.range_decode(tool.range_encode([], freqs), 0, freqs) == []
+    report = tool.compare([0.9, 0.05, 0.05], tool.sample_message(tool.quantize([0.9, 0.05, 0.05])))
+    assert abs(report['huffman_avg'] - 1.1) < 1e-9
+    assert report['entropy'] < report['bits_per_symbol'] < report['entropy'] + 0.02
+
+
+def test_adaptive_huffman():
+    tool = tools_entropy_compression.AdaptiveHuffmanTool()
+    state = 99
+    data = bytearray()
+    for _ in range(5000):
+        state = (state * 1103515245 + 12345) & 0x7FFFFFFF
+        data.append((state >> 16) % 7 * ((state >> 20) % 3))
+    data = bytes(data)
+    encoded, n_bits = tool.adaptive_encode(data)
+    assert len(encoded) == (n_bits + 7) // 8
+    assert tool.adaptive_decode(encoded, len(data)) == data
+    chunks = [data[i:i + 333] for i in range(0, len(data), 333)]
+    assert b"".join(tool.adaptive_encode_stream(chunks)) == encoded
+    parts = [encoded[i:i + 17] for i in range(0, len(encoded), 17)]
+    assert b"".join(tool.adaptive_decode_stream(parts, len(data))) == data
+    report = tool.adaptive_report(data)
+    assert report['static_bits'] <= report['adaptive_bits']
+    assert report['overhead'] < 3.0
+    assert tool.adaptive_report(b"")['adaptive_bits'] == 0
+
+
+def test_lzss():
+    tool = tools_entropy_compression.LZSS()
+    tokens = list(tool.lzss_tokens("abracadabra abracadabra"))
+    assert tokens[7] == (7, 4)
+    assert tokens[-1] == (12, 11)
+    state = 7
+    data = bytearray()
+    for _ in range(6000):
+        state = (state * 1103515245 + 12345) & 0x7FFFFFFF
+        data.append(b"abcd"[(state >> 16) % 4] if state & 0x100 else (state >> 8) & 0xFF)
+    data = bytes(data) * 3
+    for window_bits, length_bits in ((12, 4), (16, 8)):
+        for lazy in (False, True):
+            encoded = tool.lzss_encode(data, window_bits, length_bits, 16, lazy)
+            assert tool.lzss_decode(encoded, window_bits, length_bits) == data
+    # Wiederholung ausserhalb des 4K-Fensters findet nur das grössere Fenster
+    assert len(tool.lzss_encode(data, 16, 8)) < len(tool.lzss_encode(data, 12, 4)) // 2
+    assert tool.lzss_decode(tool.lzss_encode(b"a" * 100)) == b"a" * 100
+
+
+def test_bwt_pipeline():
+    tool = tools_entropy_compression.BWTTool()
+    assert tool.suffix_array(b"banana") == [5, 3, 1, 0, 4, 2]
+    assert tool.bwt(b"banana") == (b"annbaa", 4)
+    assert tool.inverse_bwt(b"annbaa", 4) == b"banana"
+    assert tool.mtf_encode(b"aabbba") == bytes([97, 0, 98, 0, 0, 1])
+    data = b"abracadabra " * 50 + b"mississippi " * 50
+    for block_size in (7, 100, 1 << 16):
+        items = tool.compress(data, block_size)
+        assert tool.decompress(items) == data
+    report = tool.pipeline_report(data)
+    assert [name for name, _ in report['stages']] == ["BWT", "MTF", "RLE", "Huffman"]
+    assert report['out_bytes'] < report['direct_bytes']
+
+
+def test_huffman_extension():
+    tool = tools_entropy_compression.HuffmanExtensionTool()
+    probs = [0.6, 0.3, 0.1]
+    classes = list(tool.extension_classes(probs, 3))
+    assert len(classes) == 10
+    assert sum(mult for _, _, mult in classes) == 27
+    # Vergleich mit dem Huffman-Code über alle 27 Produktsymbole
+    products = []
+    for a in probs:
+        for b in probs:
+            for c in probs:
+                products.append(a * b * c)
+    expected = tool.average_length(tool.huffman_code_lengths(products), products)
+    assert abs(tool.grouped_huffman_cost([(p, m) for _, p, m in classes]) - expected) < 1e-9
+    h, report = tool.extension_report([0.5, 0.25, 0.15, 0.1], 10)
+    assert report[-1]['classes'] == 286
+    assert report[-1]['symbols'] == 4 ** 10
+    assert 0 <= report[-1]['redundanz'] < report[0]['redundanz']
+    assert abs(report[0]['avg_len'] - 1.75) < 1e-9
+
+
+def test_info_analyse_cache():
+    tool = tools_entropy_compression.InfoAnalyseTool()
+    tool.symbols = ["A", "B", "C", "D"]
+    tool.probs = [0.5, 0.25, 0.125, 0.125]
+    tool.invalidate_cache()
+    assert tool.calculate_all()
+    huff = tool.create_huffman()
+    assert tool.cache_stats() == {'hits': 0, 'misses': 3, 'entries': 3}
+    assert tool.calculate_all()
+    assert tool.create_huffman() is huff
+    assert tool.cache_hits == 3
+    packed, n_bits = tools_entropy_compression.HuffmanTool().encode_bits("ABCD", huff['codes'])
+    decoded = tools_entropy_compression.HuffmanTool().decode_bits(packed, n_bits, None, tables=huff['decode'])
+    assert "".join(decoded) == "ABCD"
+    # gleiche Verteilung erneut eingegeben: Cache bleibt
+    tool.probs = [0.5, 0.25, 0.125, 0.125]
+    tool.invalidate_cache()
+    assert tool.create_huffman() is huff
+    tool.probs = [0.25, 0.25, 0.25, 0.25]
+    tool.invalidate_cache()
+    assert tool.create_huffman()['avg_len'] == 2.0
+    assert tool.cache_misses == 4
+
+
+def test_prefix_code_validator():
+    tool = tools_entropy_compression.RedundanzTool()
+    result = tool.validate_code(["0", "10", "110", "111"])
+    assert result['prefix_free'] and result['complete']
+    assert result['kraft'] == (1, 1)
+    assert result['trie'].decode("0101100111") == [0, 1, 2, 0, 3]
+    result = tool.validate_code(["0", "10", "110"])
+    assert result['kraft'] == (7, 8)
+    assert result['unused'] == ["111"]
+    result = tool.validate_code(["00", "01", "1", "0111"])
+    assert result['conflicts'] == [(3, 1)]
+    assert result['kraft'] == (17, 16) and not result['kraft_ok']
+    huffman = tools_entropy_compression.HuffmanTool()
+    codes = huffman.canonical_codes(huffman.huffman_code_lengths([i % 97 + 1 for i in range(20000)]))
+    result = tool.validate_code(codes)
+    assert result['complete'] and not result['unused']
+
+
+def test_shannon_fano():
+    tool = tools_entropy_compression.ShannonFanoTool()
+    assert tool.decimal_ratio(0.125) == (125, 1000)
+    assert tool.decimal_ratio(1e-05) == (1, 100000)
+    assert tool.shannon_fano([0.25, 0.25, 0.2, 0.15, 0.15]) == ["00", "01", "10", "110", "111"]
+    assert tool.shannon_fano_elias([0.25, 0.5, 0.125, 0.125]) == ["001", "10", "1101", "1111"]
+    rows = dict(tool.compare_codes([0.4, 0.3, 0.2, 0.1]))
+    assert abs(rows["Shannon-Fano"]['avg_len'] - 1.9) < 1e-9
+    assert abs(rows["Shannon-Fano-Elias"]['avg_len'] - 3.4) < 1e-9
+    assert abs(rows["Huffman"]['redundanz'] - tool.redundanz([0.4, 0.3, 0.2, 0.1], [1, 2, 3, 3])) < 1e-9
+    probs = [(i * 37) % 101 + 1 for i in range(5000)]
+    assert tool.validate_code(tool.shannon_fano(probs))['prefix_free']
+    assert tool.validate_code(tool.shannon_fano_elias(probs))['prefix_free']
+    for coder in (tool.shannon_fano_elias, tool.shannon_fano, tool.compare_codes):
+        try:
+            coder([0.5, 0.5, 0])
+            assert False
+        except ValueError:
+            pass
+
+
+def test_tunstall():
+    tool = tools_entropy_compression.TunstallTool()
+    tree = tool.tunstall_tree([0.7, 0.2, 0.1], 3)
+    assert tree['phrases'] == [[1], [2], [0, 1], [0, 2], [0, 0, 0], [0, 0, 1], [0, 0, 2]]
+    assert abs(tree['expected_len'] - 2.19) < 1e-9
+    message = [0, 0, 0, 1, 0, 2, 2, 0, 0]
+    encoded, words = tool.tunstall_encode(message, tree, 3)
+    assert words == 5
+    assert tool.tunstall_decode(encoded, words, len(message), tree, 3) == message
+    heap = []
+    for value in [5, 3, 9, 1, 7, 7, 2]:
+        tool.heap_push(heap, value)
+    assert [tool.heap_pop(heap) for _ in range(7)] == [9, 7, 7, 5, 3, 2, 1]
+    coder = tools_entropy_compression.RangeCoderTool()
+    report = tool.tunstall_report([0.7, 0.2, 0.1], coder.sample_message(coder.quantize([0.7, 0.2, 0.1])), 8)
+    assert report['leaves'] == 255
+    assert report['entropy'] < report['bits_per_symbol'] < report['entropy'] + 0.1
+
+
+def test_lz78_complexity():
+    tool = tools_entropy_compression.LZ78()
+    assert tool.lz78_parse("ABBCBCABABCAABCAAB") == [(0, 'A'), (0, 'B'), (2, 'C'), (3, 'A'), (2, 'A'), (4, 'A'), (6, 'B')]
+    result = tool.lz78_complexity(["ABBCB", "CABABCAABCAAB"], alphabet=3)
+    assert result['phrases'] == 7 and result['n'] == 18
+    # Zeichen über 255 dürfen im Trie nicht mit anderen Knoten kollidieren
+    assert tool.lz78_complexity(["\x01\x01\x01āā"])['phrases'] == len(tool.lz78_parse("\x01\x01\x01āā")) == 4
+    text = "".join(chr((i * 37 + (i >> 2)) % 40 + (0x100 if i % 3 else 0x20AC)) for i in range(500))
+    assert tool.lz78_complexity([text[:123], text[123:]])['phrases'] == len(tool.lz78_parse(text))
+    # Bitmodus: gepackte Bytes und '0'/'1'-Strings liefern dieselbe Zerlegung
+    data = bytes((i * 73 + (i >> 3)) & 0xFF for i in range(2000))
+    bit_str = "".join("0" * (8 - len(bin(b)[2:])) + bin(b)[2:] for b in data)
+    packed = tool.lz78_complexity([data[:999], data[999:]], True)
+    text = tool.lz78_complexity([bit_str[i:i + 77] for i in range(0, len(bit_str), 77)], True)
+    assert packed == text
+    assert packed['phrases'] == len(tool.lz78_parse(bit_str))
+    for bad in ("0120", "01a", "0 1"):
+        try:
+            tool.lz78_complexity([bad], True)
+            assert False
+        except ValueError:
+            pass
+    assert tool.lz78_complexity([b"\x00" * 2000], True)['complexity'] < packed['complexity'] / 3
+    path = _tmp_path("test_lz78.tmp")
+    try:
+        with open(path, "wb") as f:
+            f.write(data)
+        assert tool.lz78_file_complexity(path, chunk_size=100)['phrases'] == packed['phrases']
+    finally:
+        _remove(path)
+
+
+def test_gf2_kernel():
+    kernel = tools_channel_coding.GF2Kernel()
+    assert kernel.from_bits("1011") == kernel.from_bits([1, 0, 1, 1]) == 0b1011
+    assert kernel.to_bits(0b11, 4) == "0011"
+    assert kernel.divide(0b11010110110000, 0b10011) == (0b1100001010, 0b1110)
+    steps = []
+    kernel.divide(0b110101, 0b101, lambda step, rem, sub, new: steps.append((step, rem, sub, new)))
+    assert steps == [(1, 0b110101, 0b101000, 0b11101), (2, 0b11101, 0b10100, 0b1001), (3, 0b1001, 0b1010, 0b11)]
+    assert kernel.mul(0b111, 0b11) == 0b1001
+    assert kernel.gcd(kernel.mul(0b1011, 0b111), kernel.mul(0b1011, 0b1101)) == 0b1011
+    # grosser Dividend: Tabellenweg und bitweise Division stimmen überein
+    big = 1
+    for i in range(2000):
+        big = (big << 5) ^ (big >> 3) ^ (i & 31)
+    quotient, remainder = kernel.divide(big, 0x104C11DB7)
+    assert (quotient, remainder) == kernel.divide_bitwise(big, 0x104C11DB7)
+    assert kernel.mul(quotient, 0x104C11DB7) ^ remainder == big
+    assert tools_channel_coding.CyclicCodeAnalysisTool().polynomial_division_gf2("0010000", "1011") == ("0010", "110")
+    # CRC-Berechnung zeigt den echten Quotienten (früher wurde '1111' ausgegeben)
+    quotient, remainder = tools_channel_coding.CRCCalculationTool().polynomial_division_gf2(
+        "11010110110000", "10011")
+    assert (quotient, remainder) == ([1, 1, 0, 0, 0, 0, 1, 0, 1, 0], [1, 1, 1, 0])
+    try:
+        import icth_tool
+    except (ImportError, SyntaxError):
+        # MicroPython ohne f-Strings
+        icth_tool = None
+    if icth_tool is not None:
+        # Rest immer mit len(divisor) - 1 Stellen, auch bei kurzem Dividenden und Divisor '1'
+        assert icth_tool.mod2div("010", "11011") == "0010"
+        assert icth_tool.mod2div("1011", "1") == ""
+        assert icth_tool.mod2div("11010110110000", "10011") == "1110"
+
+
+def test_crc_engine():
+    engine = tools_channel_coding.CRCEngine
+    assert engine(0x104C11DB7, 0xFFFFFFFF, 0xFFFFFFFF, refin=True).checksum(b"123456789") == 0xCBF43926
+    assert engine(0x11EDC6F41, 0xFFFFFFFF, 0xFFFFFFFF, refin=True).checksum(b"123456789") == 0xE3069283
+    assert engine(0x11021, 0xFFFF).checksum(b"123456789") == 0x29B1
+    assert engine("100000111").checksum(b"123456789") == 0xF4
+    assert engine(0b1011, 7, 0, refin=True).checksum(b"123456789") == 0x6
+    assert engine(0b10001001).checksum(b"123456789") == 0x75
+    data = bytes((i * 7 + (i >> 3)) & 0xFF for i in range(1000))
+    for generator, refin in ((0x18005, True), (0x18005, False), (0x1000000AF, False), (0b100101, True)):
+        sliced = engine(generator, 0x1234, 0x55, refin=refin)
+        bytewise = engine(generator, 0x1234, 0x55, refin=refin, slices=1)
+        expected = bytewise.checksum(data)
+        assert sliced.checksum(data) == expected
+        assert sliced.reset().update(data[:333]).update(data[333:]).value() == expected
+    # binascii-Abkürzung liefert dasselbe wie die Tabellen
+    crc32 = engine(0x104C11DB7, 0xFFFFFFFF, 0xFFFFFFFF, refin=True)
+    crc32.reset().update_bytes(data, 0, len(data))
+    assert crc32.value() == crc32.checksum(data)
+    path = _tmp_path("test_crc.tmp")
+    try:
+        with open(path, "wb") as f:
+            f.write(data)
+        assert crc32.file_checksum(path, chunk_size=100) == crc32.checksum(data)
+    finally:
+        _remove(path)
+    # Bitstrings beliebiger Länge: Ergebnis wie bei der Polynomdivision
+    kernel = tools_channel_coding.GF2Kernel()
+    bits = "1101011011" * 7
+    assert engine("10011").update_bits(bits).value() == kernel.mod(int(bits, 2) << 4, 0b10011)
+    check = tools_channel_coding.CRCCheckTool()
+    assert check.crc_remainder("11010110111110", "10011") == [0, 0, 0, 0]
+    assert check.crc_remainder(bits, "10011") == check.polynomial_division_gf2(bits, "10011")[1]
+    assert check.crc_check("11010110111110", "10011") is True
+    assert check.crc_check("11010110111111", "10011") is False
+    # Rest immer mit Grad von g(x) Stellen, wie die CRC-Prüfbits (früher "Rest = 110")
+    assert check.crc_remainder("1010100110", "10101") == [0, 1, 1, 0]
+    assert check.crc_check("1010100110", "10101") is False
+
+
+def test_crc_parallel():
+    tool = tools_channel_coding.CRCParallelTool()
+    data = bytes((i * 13 + (i >> 5)) & 0xFF for i in range(3000))
+    for generator, init, xorout, refin in ((0x104C11DB7, 0xFFFFFFFF, 0xFFFFFFFF, True), (0x11021, 0xFFFF, 0, False),
+                                           (0b1011, 5, 3, True), (0x142F0E1EBA9EA3693, 7, 9, False)):
+        engine = tools_channel_coding.CRCEngine(generator, init, xorout, refin)
+        expected = engine.checksum(data)
+        for chunk_size in (1, 100, 4096):
+            assert tool.crc_parallel(data, generator, 1, chunk_size, init, xorout, refin) == expected
+        assert tool.crc_parallel(data, generator, 2, 700, init, xorout, refin) == expected
+        assert engine.combine(engine.checksum(data[:1234]), engine.checksum(data[1234:]), len(data) - 1234) == expected
+    path = _tmp_path("test_crc_parallel.tmp")
+    try:
+        with open(path, "wb") as f:
+            f.write(data)
+        assert tool.crc_parallel(path, "100000111", 2, 333) == \
+            tools_channel_coding.CRCEngine("100000111").checksum(data)
+    finally:
+        _remove(path)
+    rows = tool.crc_benchmark("100000111", 5000, 2, 1000, filename=_tmp_path("test_crc_benchmark.tmp"))
+    assert [row['workers'] for row in rows] == [0, 1, 2]
+    assert all(row['identical'] for row in rows)
+
+
 def run_all_tests():
     fail = False
     for func in _get_test_functions():
@@ -1,5 +1,389 @@
+import os
+import time
+
 import tool_base
 
+try:
+    import binascii
+except ImportError:
+    binascii = None
+
+try:
+    import tempfile
+except ImportError:
+    # MicroPython: kein tempfile, Benchmark-Datei im aktuellen Verzeichnis
+    tempfile = None
+
+try:
+    import multiprocessing
+except ImportError:
+    # MicroPython: keine Prozesse, crc_parallel rechnet seriell
+    multiprocessing = None
+
+
+class GF2Kernel(object):
+    """Polynome über GF(2) als int: Bit i ist der Koeffizient von x^i"""
+    TABLE_BITS = 8
+    # Reduktionstabellen pro Divisor, von allen Instanzen geteilt
+    tables = {}
+
+    def from_bits(self, bits):
+        """'1011', [1, 0, 1, 1] oder int -> int, höchste Potenz zuerst"""
+        if isinstance(bits, int):
+            return bits
+        if not isinstance(bits, str):
+            bits = "".join(str(bit) for bit in bits)
+        bits = bits.replace(" ", "").replace("'", "")
+        return int(bits, 2) if bits else 0
+
+    def to_bits(self, poly, width=1):
+        """Binärstring, links mit Nullen auf width Stellen aufgefüllt"""
+        bits = bin(poly)[2:] if poly else ""
+        if len(bits) < width:
+            bits = "0" * (width - len(bits)) + bits
+        return bits
+
+    def to_hex(self, poly, digits=1):
+        text = "{:x}".format(poly)
+        return "0" * (digits - len(text)) + text
+
+    def to_vector(self, poly, width=1):
+        return [int(bit) for bit in self.to_bits(poly, width)]
+
+    def degree(self, poly):
+        """Grad, -1 für das Nullpolynom"""
+        return len(bin(poly)) - 3 if poly else -1
+
+    def mul(self, a, b):
+        """Produkt durch Schieben und XOR"""
+        if self.degree(a) < self.degree(b):
+            a, b = b, a
+        result = 0
+        shift = 0
+        while b:
+            if b & 1:
+                result ^= a << shift
+            b >>= 1
+            shift += 1
+        return result
+
+    def divide(self, a, b, trace=None):
+        """Gibt (Quotient, Rest) zurück. trace(schritt, rest, verschobener_divisor, neuer_rest)
+        wird bei jedem XOR-Schritt aufgerufen; ohne trace wird byteweise über eine Tabelle reduziert."""
+        if not b:
+            raise ValueError("Division durch Null")
+        db = self.degree(b)
+        if trace is None and self.degree(a) - db >= 2 * self.TABLE_BITS:
+            return self.divide_table(a, b, db)
+        return self.divide_bitwise(a, b, trace)
+
+    def divide_bitwise(self, a, b, trace=None):
+        """Schulmethode: führende 1 des Rests mit dem verschobenen Divisor tilgen"""
+        db = self.degree(b)
+        q = 0
+        r = a
+        dr = self.degree(r)
+        step = 1
+        while dr >= db:
+            shift = dr - db
+            subtrahend = b << shift
+            q |= 1 << shift
+            if trace is not None:
+                trace(step, r, subtrahend, r ^ subtrahend)
+            r ^= subtrahend
+            dr = self.degree(r)
+            step += 1
+        return q, r
+
+    def reduction_table(self, b, db):
+        """Für jedes Byte t: (t * x^db) div b als Hexziffern und (t * x^db) mod b"""
+        table = self.tables.get(b)
+        if table is None:
+            if len(self.tables) >= 64:
+                self.tables.clear()
+            table = []
+            for t in range(1 << self.TABLE_BITS):
+                q, r = self.divide_bitwise(t << db, b)
+                table.append(("{:02x}".format(q), r))
+            self.tables[b] = table
+        return table
+
+    def divide_table(self, a, b, db):
+        """Lange Division in Schritten zu 8 Bit, der Rest bleibt dabei kleiner als b"""
+        table = self.reduction_table(b, db)
+        mask = (1 << db) - 1
+        digits = "{:x}".format(a)
+        if len(digits) & 1:
+            digits = "0" + digits
+        try:
+            chunks = bytes.fromhex(digits)
+        except AttributeError:
+            # MicroPython: kein bytes.fromhex
+            chunks = [int(digits[i:i + 2], 16) for i in range(0, len(digits), 2)]
+        r = 0
+        quotient = []
+        for byte in chunks:
+            r = (r << 8) | byte
+            q_part, r_part = table[r >> db]
+            r = (r & mask) ^ r_part
+            quotient.append(q_part)
+        return int("".join(quotient), 16), r
+
+    def mod(self, a, b):
+        return self.divide(a, b)[1]
+
+    def mulmod(self, a, b, m):
+        return self.mod(self.mul(a, b), m)
+
+    def gcd(self, a, b):
+        while b:
+            a, b = b, self.mod(a, b)
+        return a
+
+
+class CRCEngine(object):
+    """Tabellengesteuerte CRC nach dem Rocksoft-Modell (width, poly, init, refin, refout, xorout).
+    generator ist das volle Generatorpolynom wie bei CRCCalculationTool, z.B. '1011' oder 0x104C11DB7."""
+    SLICES = 8
+    # Tabellen pro (poly, width, refin), von allen Instanzen geteilt
+    tables = {}
+
+    def __init__(self, generator, init=0, xorout=0, refin=False, refout=None, slices=SLICES):
+        kernel = GF2Kernel()
+        g = kernel.from_bits(generator)
+        self.width = kernel.degree(g)
+        if self.width < 1:
+            raise ValueError("Generatorpolynom braucht Grad >= 1")
+        self.mask = (1 << self.width) - 1
+        self.poly = g & self.mask
+        self.refin = refin
+        self.refout = refin if refout is None else refout
+        self.init = init & self.mask
+        self.xorout = xorout & self.mask
+        # Register mit weniger als 8 Bit werden nicht reflektiert linksbündig in 8 Bit geführt
+        self.shift = 8 - self.width if self.width < 8 and not refin else 0
+        # slices=1: nur die 256er-Tabelle; Slicing nur bis 64 Bit Registerbreite
+        self.slices = slices if self.width + self.shift <= 64 else 1
+        self.native = self.native_update()
+        self.reset()
+
+    def native_update(self):
+        """Eingebaute Routine, falls das Polynom zu binascii.crc32 oder crc_hqx passt"""
+        if self.width == 32 and self.poly == 0x04C11DB7 and self.refin:
+            crc32 = getattr(binascii, "crc32", None)
+            if crc32 is not None:
+                return lambda reg, data: crc32(data, reg ^ 0xFFFFFFFF) ^ 0xFFFFFFFF
+        if self.width == 16 and self.poly == 0x1021 and not self.refin:
+            crc_hqx = getattr(binascii, "crc_hqx", None)
+            if crc_hqx is not None:
+                return lambda reg, data: crc_hqx(data, reg)
+        return None
+
+    def reflect(self, value, width):
+        result = 0
+        for i in range(width):
+            result = (result << 1) | (value & 1)
+            value >>= 1
+        return result
+
+    def table_set(self):
+        """[T0, T1, ...]: Tk[b] ist der Registerbeitrag von Byte b, gefolgt von k Nullbytes"""
+        key = (self.poly, self.width, self.refin)
+        tables = self.tables.get(key)
+        if tables is None:
+            if len(self.tables) >= 16:
+                self.tables.clear()
+            tables = [self.byte_table()]
+            self.tables[key] = tables
+        return tables
+
+    def byte_table(self):
+        width = self.width + self.shift
+        table = []
+        if self.refin:
+            poly = self.reflect(self.poly, self.width)
+            for byte in range(256):
+                reg = byte
+                for _ in range(8):
+                    reg = (reg >> 1) ^ poly if reg & 1 else reg >> 1
+                table.append(reg)
+        else:
+            poly = self.poly << self.shift
+            top = 1 << (width - 1)
+            mask = (1 << width) - 1
+            for byte in range(256):
+                reg = byte << (width - 8)
+                for _ in range(8):
+                    reg = ((reg << 1) ^ poly) & mask if reg & top else (reg << 1) & mask
+                table.append(reg)
+        return table
+
+    def slice_tables(self):
+        """Tabellen T0..T7 für Slicing-by-8, nur bei Registern bis 64 Bit sinnvoll"""
+        tables = self.table_set()
+        if len(tables) < self.SLICES:
+            t0 = tables[0]
+            width = self.width + self.shift
+            mask = (1 << width) - 1
+            while len(tables) < self.SLICES:
+                prev = tables[-1]
+                if self.refin:
+                    tables.append([(v >> 8) ^ t0[v & 0xFF] for v in prev])
+                else:
+                    tables.append([((v << 8) & mask) ^ t0[v >> (width - 8)] for v in prev])
+        return tables
+
+    def reset(self):
+        self.register = (self.reflect(self.init, self.width) if self.refin else self.init) << self.shift
+        return self
+
+    def update(self, data):
+        """Verarbeitet bytes in Blöcken zu 8 Byte, den Rest byteweise"""
+        if self.native is not None:
+            self.register = self.native(self.register, data)
+            return self
+        n = len(data)
+        blocks = n - n % self.SLICES if self.slices == self.SLICES and n >= 4 * self.SLICES else 0
+        if blocks:
+            self.update_slices(data, blocks)
+        if blocks < n:
+            self.update_bytes(data, blocks, n)
+        return self
+
+    def update_bytes(self, data, start, end):
+        table = self.table_set()[0]
+        reg = self.register
+        if self.refin:
+            for i in range(start, end):
+                reg = (reg >> 8) ^ table[(reg ^ data[i]) & 0xFF]
+        else:
+            width = self.width + self.shift
+            mask = (1 << width) - 1
+            down = width - 8
+            for i in range(start, end):
+                reg = ((reg << 8) & mask) ^ table[((reg >> down) ^ data[i]) & 0xFF]
+        self.register = reg
+
+    def update_slices(self, data, end):
+        t0, t1, t2, t3, t4, t5, t6, t7 = self.slice_tables()
+        reg = self.register
+        if self.refin:
+            for i in range(0, end, 8):
+                reg = (t7[(reg ^ data[i]) & 0xFF] ^ t6[((reg >> 8) ^ data[i + 1]) & 0xFF]
+                       ^ t5[((reg >> 16) ^ data[i + 2]) & 0xFF] ^ t4[((reg >> 24) ^ data[i + 3]) & 0xFF]
+                       ^ t3[((reg >> 32) ^ data[i + 4]) & 0xFF] ^ t2[((reg >> 40) ^ data[i + 5]) & 0xFF]
+                       ^ t1[((reg >> 48) ^ data[i + 6]) & 0xFF] ^ t0[((reg >> 56) ^ data[i + 7]) & 0xFF])
+        else:
+            # Register linksbündig in 64 Bit, dann wie im reflektierten Fall von oben her abbauen
+            up = 64 - self.width - self.shift
+            for i in range(0, end, 8):
+                reg <<= up
+                reg = (t7[(reg >> 56) ^ data[i]] ^ t6[((reg >> 48) ^ data[i + 1]) & 0xFF]
+                       ^ t5[((reg >> 40) ^ data[i + 2]) & 0xFF] ^ t4[((reg >> 32) ^ data[i + 3]) & 0xFF]
+                       ^ t3[((reg >> 24) ^ data[i + 4]) & 0xFF] ^ t2[((reg >> 16) ^ data[i + 5]) & 0xFF]
+                       ^ t1[((reg >> 8) ^ data[i + 6]) & 0xFF] ^ t0[(reg ^ data[i + 7]) & 0xFF])
+        self.register = reg
+
+    def update_bits(self, bits):
+        """Bitstring in Übertragungsreihenfolge, Länge beliebig; ganze Bytes laufen über die Tabelle"""
+        bits = bits.replace(" ", "").replace("'", "")
+        head = len(bits) % 8
+        reg = self.register
+        if self.refin:
+            poly = self.reflect(self.poly, self.width)
+            for bit in bits[:head]:
+                reg = (reg >> 1) ^ poly if (reg ^ int(bit)) & 1 else reg >> 1
+        else:
+            width = self.width + self.shift
+            poly = self.poly << self.shift
+            top = 1 << (width - 1)
+            mask = (1 << width) - 1
+            for bit in bits[:head]:
+                if bit == "1":
+                    reg ^= top
+                reg = ((reg << 1) ^ poly) & mask if reg & top else (reg << 1) & mask
+        self.register = reg
+        if head < len(bits):
+            if self.refin:
+                data = bytes(int(bits[i:i + 8][::-1], 2) for i in range(head, len(bits), 8))
+            else:
+                data = bytes(int(bits[i:i + 8], 2) for i in range(head, len(bits), 8))
+            self.update(data)
+        return self
+
+    def update_file(self, filename, chunk_size=65536):
+        with open(filename, "rb") as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                self.update(chunk)
+        return self
+
+    def value(self):
+        """CRC des bisher verarbeiteten Stroms; der Zustand bleibt erhalten"""
+        reg = self.register >> self.shift
+        if self.refin != self.refout:
+            reg = self.reflect(reg, self.width)
+        return reg ^ self.xorout
+
+    def checksum(self, data):
+        return self.reset().update(data).value()
+
+    def file_checksum(self, filename, chunk_size=65536):
+        return self.reset().update_file(filename, chunk_size).value()
+
+    def natural_register(self):
+        """Register als Polynom mod g(x), unabhängig von refin"""
+        reg = self.register >> self.shift
+        return self.reflect(reg, self.width) if self.refin else reg
+
+    def finalize(self, natural):
+        """Polynom-Register -> CRC-Wert mit refout und xorout"""
+        return (self.reflect(natural, self.width) if self.refout else natural) ^ self.xorout
+
+    def unfinalize(self, crc):
+        crc ^= self.xorout
+        return self.reflect(crc, self.width) if self.refout else crc
+
+    def shift_bytes(self, natural, nbytes):
+        """natural * x^(8 * nbytes) mod g(x); die Potenz per Quadrieren und Multiplizieren"""
+        kernel = GF2Kernel()
+        g = (1 << self.width) | self.poly
+        power = 1
+        base = kernel.mod(1 << 8, g)
+        while nbytes:
+            if nbytes & 1:
+                power = kernel.mulmod(power, base, g)
+            base = kernel.mulmod(base, base, g)
+            nbytes >>= 1
+        return kernel.mulmod(natural, power, g)
+
+    def combine(self, crc1, crc2, len2):
+        """CRC von A+B aus CRC(A), CRC(B) und der Länge von B in Bytes, wie zlib crc32_combine.
+        Beide Register enthalten init; A wird um B verschoben, das doppelte init fällt dabei weg."""
+        r1 = self.unfinalize(crc1) ^ self.init
+        return self.finalize(self.shift_bytes(r1, len2) ^ self.unfinalize(crc2))
+
+
+def crc_chunk(job):
+    """Worker für CRCParallelTool: Polynom-Register eines Abschnitts mit init = 0.
+    job = (generator, refin, quelle, offset, länge), quelle ist ein Dateiname oder bytes."""
+    generator, refin, source, offset, length = job
+    engine = CRCEngine(generator, refin=refin)
+    if isinstance(source, str):
+        with open(source, "rb") as f:
+            f.seek(offset)
+            while length > 0:
+                block = f.read(min(length, 65536))
+                if not block:
+                    break
+                engine.update(block)
+                length -= len(block)
+    else:
+        engine.update(source)
+    return engine.natural_register()
+
 
 class BaseChannelCodingTool(tool_base.Tool):
     """Basis-Klasse für alle Kanalcodierung-Tools mit gemeinsamen Funktionen"""
@@ -526,84 +910,49 @@ class CRCCalculationTool(BaseChannelCodingTool):
     def polynomial_division_gf2(self, dividend, divisor, validate=True):
         """Polynomdivision in GF(2)"""
         print("\n==== POLYNOMDIVISION IN GF(2) ====")
+        kernel = GF2Kernel()
 
         if isinstance(dividend, str):
             dividend_str = dividend.replace(" ", "").replace("'", "")
-            dividend = self.binary_to_vector(dividend_str)
         else:
             dividend_str = self.vector_to_binary(dividend)
 
         if isinstance(divisor, str):
             divisor_str = divisor.replace(" ", "").replace("'", "")
-            divisor = self.binary_to_vector(divisor_str)
         else:
             divisor_str = self.vector_to_binary(divisor)
 
         print("Dividend:  " + dividend_str)
         print("Divisor:   " + divisor_str)
 
-        while len(dividend) > 1 and dividend[0] == 0:
-            dividend = dividend[1:]
-        while len(divisor) > 1 and divisor[0] == 0:
-            divisor = divisor[1:]
+        a = kernel.from_bits(dividend_str)
+        g = kernel.from_bits(divisor_str)
+        width = max(1, kernel.degree(g))
 
-        if len(dividend) < len(divisor):
+        if kernel.degree(a) < kernel.degree(g):
             print("\nSpezialfall: Dividend-Grad < Divisor-Grad")
             print("Quotient: 0")
-            print("Rest:     " + self.vector_to_binary(dividend))
-            return [0], dividend
-
-        quotient = []
-        remainder = dividend[:]
+            print("Rest:     " + kernel.to_bits(a))
+            return [0], kernel.to_vector(a, width)
 
         print("\nDivisions-Schritte:")
-        step = 1
-
-        while len(remainder) >= len(divisor):
-            has_ones = False
-            for bit in remainder:
-                if bit == 1:
-                    has_ones = True
-                    break
-            if not has_ones:
-                break
-
-            while len(remainder) > 1 and remainder[0] == 0:
-                remainder = remainder[1:]
-
-            if len(remainder) < len(divisor):
-                break
-
-            quotient.append(1)
 
+        def show_step(step, remainder, subtrahend, result):
             print("Schritt " + str(step) + ":")
-            print("  " + self.vector_to_binary(remainder))
-
-            for i in range(len(divisor)):
-                if i < len(remainder):
-                    remainder[i] = (remainder[i] + divisor[i]) % 2
-
-            print("  " + self.vector_to_binary(divisor))
+            print("  " + kernel.to_bits(remainder))
+            print("  " + kernel.to_bits(g))
             print("  " + "-" * len(dividend_str))
-            print("  " + self.vector_to_binary(remainder))
+            print("  " + kernel.to_bits(result, kernel.degree(remainder) + 1))
             print()
 
-            if remainder and remainder[0] == 0:
-                remainder = remainder[1:]
-
-            step += 1
-
-        if not quotient:
-            quotient = [0]
-        if not remainder:
-            remainder = [0]
+        q, r = kernel.divide(a, g, show_step)
 
-        quotient_str = self.vector_to_binary(quotient)
-        remainder_str = self.vector_to_binary(remainder)
+        quotient = kernel.to_vector(q)
+        remainder = kernel.to_vector(r, width)
 
         print("Ergebnis:")
-        print("  Quotient: " + quotient_str)
-        print("  Rest:     " + remainder_str)
+        print("  Quotient: " + self.vector_to_binary(quotient))
+        print("  Rest:     " + self.vector_to_binary(remainder))
 
         return quotient, remainder
 
@@ -694,59 +1043,21 @@ class CRCCheckTool(BaseChannelCodingTool):
 
     def polynomial_division_gf2(self, dividend, divisor, validate=True):
         """Polynomdivision in GF(2) - vereinfachte Version für CRC-Check"""
-        if isinstance(dividend, str):
-            dividend_str = dividend.replace(" ", "").replace("'", "")
-            dividend = self.binary_to_vector(dividend_str)
-        else:
-            dividend_str = self.vector_to_binary(dividend)
-
-        if isinstance(divisor, str):
-            divisor_str = divisor.replace(" ", "").replace("'", "")
-            divisor = self.binary_to_vector(divisor_str)
+        kernel = GF2Kernel()
+        g = kernel.from_bits(divisor)
+        q, r = kernel.divide(kernel.from_bits(dividend), g)
+        return kernel.to_vector(q), kernel.to_vector(r, max(1, kernel.degree(g)))
+
+    def crc_remainder(self, word, generator_poly):
+        """Rest von word mod g(x) über die CRC-Tabellen: die vorderen Bits laufen als Nachricht
+        (liefert M * x^r mod g), die letzten r Bits werden danach direkt addiert"""
+        engine = CRCEngine(generator_poly)
+        width = engine.width
+        if len(word) <= width:
+            remainder = int(word, 2)
         else:
-            divisor_str = self.vector_to_binary(divisor)
-
-        while len(dividend) > 1 and dividend[0] == 0:
-            dividend = dividend[1:]
-        while len(divisor) > 1 and divisor[0] == 0:
-            divisor = divisor[1:]
-
-        if len(dividend) < len(divisor):
-            return [0], dividend
-
-        quotient = []
-        remainder = dividend[:]
-
-        while len(remainder) >= len(divisor):
-            has_ones = False
-            for bit in remainder:
-                if bit == 1:
-                    has_ones = True
-                    break
-            if not has_ones:
-                break
-
-            while len(remainder) > 1 and remainder[0] == 0:
-                remainder = remainder[1:]
-
-            if len(remainder) < len(divisor):
-                break
-
-            quotient.append(1)
-
-            for i in range(len(divisor)):
-                if i < len(remainder):
-                    remainder[i] = (remainder[i] + divisor[i]) % 2
-
-            if remainder and remainder[0] == 0:
-                remainder = remainder[1:]
-
-        if not quotient:
-            quotient = [0]
-        if not remainder:
-            remainder = [0]
-
-        return quotient, remainder
+            remainder = engine.update_bits(word[:-width]).value() ^ int(word[-width:], 2)
+        return GF2Kernel().to_vector(remainder, width)
 
     def crc_check(self, received_word, generator_poly, validate=True):
         """CRC-Prüfung eines empfangenen Wortes"""
@@ -764,22 +1075,18 @@ class CRCCheckTool(BaseChannelCodingTool):
 
         if isinstance(received_word, str):
             clean_word = received_word.replace(" ", "").replace("'", "")
-            received_vec = self.binary_to_vector(clean_word)
         else:
-            received_vec = received_word
-            clean_word = self.vector_to_binary(received_vec)
+            clean_word = self.vector_to_binary(received_word)
 
         if isinstance(generator_poly, str):
             clean_poly = generator_poly.replace(" ", "").replace("'", "")
-            poly_vec = self.binary_to_vector(clean_poly)
         else:
-            poly_vec = generator_poly
-            clean_poly = self.vector_to_binary(poly_vec)
+            clean_poly = self.vector_to_binary(generator_poly)
 
         print("Empfangenes Wort: " + clean_word)
         print("Generatorpolynom: " + clean_poly)
 
-        quotient, remainder = self.polynomial_division_gf2(received_vec, poly_vec, validate=False)
+        remainder = self.crc_remainder(clean_word, clean_poly)
 
         all_zero = True
         for bit in remainder:
@@ -832,6 +1139,130 @@ class CRCCheckTool(BaseChannelCodingTool):
         input("\nDrücke Enter zum Fortfahren...")
 
 
+class CRCParallelTool(CRCCalculationTool):
+    """CRC großer Dateien: Abschnitte parallel berechnen und per CRC-Combine zusammenführen"""
+    CHUNK_SIZE = 1 << 20
+
+    def crc_jobs(self, source, generator_poly, refin, chunk_size):
+        """Zerlegt Datei oder bytes in Abschnitte; Dateien lesen die Worker selbst"""
+        if isinstance(source, str):
+            with open(source, "rb") as f:
+                f.seek(0, 2)
+                size = f.tell()
+            return [(generator_poly, refin, source, offset, min(chunk_size, size - offset))
+                    for offset in range(0, size, chunk_size)]
+        return [(generator_poly, refin, source[offset:offset + chunk_size], offset, 0)
+                for offset in range(0, len(source), chunk_size)]
+
+    def crc_parallel(self, source, generator_poly, workers=None, chunk_size=CHUNK_SIZE,
+                     init=0, xorout=0, refin=False, refout=None):
+        """CRC über Datei (Pfad) oder bytes; bitgleich zu CRCEngine.checksum bzw. file_checksum"""
+        engine = CRCEngine(generator_poly, init, xorout, refin, refout)
+        jobs = self.crc_jobs(source, generator_poly, refin, chunk_size)
+        if workers is None:
+            workers = multiprocessing.cpu_count() if multiprocessing is not None else 1
+        if multiprocessing is not None and workers > 1 and len(jobs) > 1:
+            with multiprocessing.Pool(min(workers, len(jobs))) as pool:
+                registers = pool.map(crc_chunk, jobs, 1)
+        else:
+            registers = [crc_chunk(job) for job in jobs]
+
+        # init läuft als Register vor dem ersten Abschnitt mit; Verschiebung pro Länge nur einmal
+        kernel = GF2Kernel()
+        g = (1 << engine.width) | engine.poly
+        natural = engine.init
+        powers = {}
+        for register, job in zip(registers, jobs):
+            length = job[4] if isinstance(job[2], str) else len(job[2])
+            if length not in powers:
+                powers[length] = engine.shift_bytes(1, length)
+            natural = kernel.mulmod(natural, powers[length], g) ^ register
+        return engine.finalize(natural)
+
+    def random_block(self, size=65536):
+        """Zufallsbytes für die Testdatei, ohne os.urandom per LCG"""
+        try:
+            return os.urandom(size)
+        except (AttributeError, NotImplementedError):
+            block = bytearray(size)
+            seed = 1
+            for i in range(size):
+                seed = (seed * 1103515245 + 12345) & 0x7FFFFFFF
+                block[i] = seed >> 16 & 0xFF
+            return bytes(block)
+
+    def crc_benchmark(self, generator_poly, size, max_workers, chunk_size=CHUNK_SIZE,
+                      refin=False, filename=None):
+        """Laufzeit für 1..max_workers Prozesse über eine Testdatei der Größe size;
+        die Datei besteht aus einem wiederholten 64-KB-Zufallsblock und liegt im Temp-Verzeichnis"""
+        if filename is None:
+            filename = "crc_benchmark.tmp"
+            if tempfile is not None:
+                filename = os.path.join(tempfile.gettempdir(), filename)
+        block = self.random_block()
+        with open(filename, "wb") as f:
+            for offset in range(0, size, len(block)):
+                f.write(block[:size - offset])
+        try:
+            start = time.time()
+            serial = CRCEngine(generator_poly, refin=refin).file_checksum(filename)
+            base = time.time() - start
+            rows = [{'workers': 0, 'seconds': base, 'speedup': 1.0, 'crc': serial, 'identical': True}]
+            for workers in range(1, max_workers + 1):
+                start = time.time()
+                crc = self.crc_parallel(filename, generator_poly, workers, chunk_size, refin=refin)
+                seconds = time.time() - start
+                rows.append({'workers': workers, 'seconds': seconds,
+                             'speedup': base / seconds if seconds > 0 else 0.0,
+                             'crc': crc, 'identical': crc == serial})
+        finally:
+            try:
+                os.remove(filename)
+            except OSError:
+                pass
+        return rows
+
+    def run(self):
+        """CRC einer Datei parallel berechnen oder Skalierung messen"""
+        try:
+            print("\n=== CRC PARALLEL ===")
+
+            while True:
+                generator = input("Generatorpolynom: ").strip()
+                errors, warnings = self.validate_generator_polynomial(generator)
+                if not errors:
+                    break
+                for error in errors:
+                    print("❌ " + error)
+            generator = generator.replace(" ", "").replace("'", "")
+            refin = input("Reflektiert (j/n): ").strip().lower() == "j"
+            filename = input("Datei (leer = Benchmark): ").strip()
+            kernel = GF2Kernel()
+            digits = (len(generator) + 2) // 4
+
+            if filename:
+                workers = self.safe_int_input("Prozesse: ", 1, 64)
+                start = time.time()
+                crc = self.crc_parallel(filename, generator, workers, refin=refin)
+                print("CRC: 0x" + kernel.to_hex(crc, digits))
+                print("Zeit: {:.3f} s".format(time.time() - start))
+            else:
+                size = self.safe_int_input("Größe in KB: ", 1, 1 << 22)
+                max_workers = self.safe_int_input("Max. Prozesse: ", 1, 64)
+                chunk_size = max(1024, size * 1024 // (4 * max_workers))
+                print("\nProzesse  Zeit [s]  Speedup  CRC")
+                for row in self.crc_benchmark(generator, size * 1024, max_workers, chunk_size, refin):
+                    label = "seriell" if row['workers'] == 0 else str(row['workers'])
+                    print("{:>8}  {:8.3f}  {:6.2f}x  0x{} {}".format(
+                        label, row['seconds'], row['speedup'], kernel.to_hex(row['crc'], digits),
+                        "✅" if row['identical'] else "❌"))
+
+        except Exception as e:
+            print("❌ Fehler: " + str(e))
+
+        input("\nDrücke Enter zum Fortfahren...")
+
+
 class PolynomialDivisionTool(BaseChannelCodingTool):
     """Tool für Polynomdivision in GF(2)"""
 
@@ -857,109 +1288,48 @@ class PolynomialDivisionTool(BaseChannelCodingTool):
     def polynomial_division_gf2(self, dividend, divisor, validate=True):
         """Polynomdivision in GF(2)"""
         print("=== POLY DIV GF(2) ===")
+        kernel = GF2Kernel()
 
         # Input-Konvertierung
         if isinstance(dividend, str):
             dividend_str = dividend.replace(" ", "").replace("'", "")
-            dividend = self.binary_to_vector(dividend_str)
         else:
             dividend_str = self.vector_to_binary(dividend)
 
         if isinstance(divisor, str):
             divisor_str = divisor.replace(" ", "").replace("'", "")
-            divisor = self.binary_to_vector(divisor_str)
         else:
             divisor_str = self.vector_to_binary(divisor)
 
         print("D: " + dividend_str)
         print("G: " + divisor_str)
 
-        # Kopien erstellen für Bearbeitung
-        dividend_work = dividend[:]
-        divisor_work = divisor[:]
-
-        # Führende Nullen entfernen
-        while len(dividend_work) > 1 and dividend_work[0] == 0:
-            dividend_work = dividend_work[1:]
-        while len(divisor_work) > 1 and divisor_work[0] == 0:
-            divisor_work = divisor_work[1:]
+        a = kernel.from_bits(dividend_str)
+        g = kernel.from_bits(divisor_str)
 
         # Spezialfall: Dividend kleiner als Divisor
-        if len(dividend_work) < len(divisor_work):
+        if kernel.degree(a) < kernel.degree(g):
             print("Fall: D < G")
             print("Q: 0")
-            print("R: " + self.vector_to_binary(dividend_work))
-            return [0], dividend_work
-
-        # Quotient initialisieren mit der richtigen Länge
-        quotient_length = len(dividend_work) - len(divisor_work) + 1
-        quotient = [0] * quotient_length
-        remainder = dividend_work[:]
+            print("R: " + kernel.to_bits(a))
+            return [0], kernel.to_vector(a)
 
         print("--- Schritte ---")
-        step = 1
-
-        # Hauptschleife der Division
-        while len(remainder) >= len(divisor_work) and any(bit == 1 for bit in remainder):
-            # Führende Nullen entfernen
-            while len(remainder) > 1 and remainder[0] == 0:
-                remainder = remainder[1:]
-
-            # Prüfen ob noch Division möglich
-            if len(remainder) < len(divisor_work):
-                break
 
-            # Prüfen ob höchster Bit gesetzt ist
-            if remainder[0] == 1:
-                # Berechne Position basierend auf aktuellem Grad
-                current_degree = len(remainder) - 1
-                divisor_degree = len(divisor_work) - 1
-                quotient_degree = current_degree - divisor_degree
-                # Array-Index: höchster Grad am Anfang
-                quotient_pos = (quotient_length - 1) - quotient_degree
+        def show_step(step, remainder, subtrahend, result):
+            # Kompakte Ausgabe für Taschenrechner
+            width = kernel.degree(remainder) + 1
+            print(str(step) + ": " + kernel.to_bits(remainder))
+            print("   " + kernel.to_bits(subtrahend))
+            print("   " + kernel.to_bits(result, width))
 
-                # Setze 1 an der berechneten Position
-                if quotient_pos >= 0 and quotient_pos < len(quotient):
-                    quotient[quotient_pos] = 1
-
-                # Kompakte Ausgabe für Taschenrechner
-                print(str(step) + ": " + self.vector_to_binary(remainder))
-
-                # Erstelle verschobenen Divisor
-                divisor_shifted = divisor_work[:]
-                # Füge Nullen rechts hinzu um gleiche Länge zu haben
-                while len(divisor_shifted) < len(remainder):
-                    divisor_shifted.append(0)
-
-                print("   " + self.vector_to_binary(divisor_shifted))
-
-                # XOR Operation (Polynom-Subtraktion in GF(2))
-                for j in range(len(remainder)):
-                    remainder[j] = (remainder[j] + divisor_shifted[j]) % 2
-
-                print("   " + self.vector_to_binary(remainder))
-                step = step + 1
-
-            else:
-                # Wenn höchster Bit 0 ist, verschiebe einfach
-                remainder = remainder[1:] if len(remainder) > 1 else [0]
-
-        # Quotient-Nullen entfernen
-        while len(quotient) > 1 and quotient[0] == 0:
-            quotient = quotient[1:]
-
-        # Rest aufräumen
-        while len(remainder) > 1 and remainder[0] == 0:
-            remainder = remainder[1:]
-        if not remainder or all(x == 0 for x in remainder):
-            remainder = [0]
-
-        quotient_str = self.vector_to_binary(quotient)
-        remainder_str = self.vector_to_binary(remainder)
+        q, r = kernel.divide(a, g, show_step)
+        quotient = kernel.to_vector(q)
+        remainder = kernel.to_vector(r)
 
         print("--- Ergebnis ---")
-        print("Q: " + quotient_str)
-        print("R: " + remainder_str)
+        print("Q: " + self.vector_to_binary(quotient))
+        print("R: " + self.vector_to_binary(remainder))
 
         return quotient, remainder
 
@@ -1011,41 +1381,11 @@ class PolynomialDivisionTool(BaseChannelCodingTool):
     def verify_division(self, dividend, divisor, quotient, remainder):
         """Verifikation: D = Q*G + R"""
         try:
-            # Konvertiere zu Listen falls nötig
-            if isinstance(dividend, str):
-                dividend = self.binary_to_vector(dividend)
-            if isinstance(divisor, str):
-                divisor = self.binary_to_vector(divisor)
-            if isinstance(quotient, str):
-                quotient = self.binary_to_vector(quotient)
-            if isinstance(remainder, str):
-                remainder = self.binary_to_vector(remainder)
-
-            # Berechne Q * G (Polynommultiplikation in GF(2))
-            if quotient == [0]:
-                product = [0]
-            else:
-                # Einfache Polynommultiplikation
-                product = [0] * (len(quotient) + len(divisor) - 1)
-                for i in range(len(quotient)):
-                    if quotient[i] == 1:
-                        for j in range(len(divisor)):
-                            product[i + j] = (product[i + j] + divisor[j]) % 2
-
-            # Addiere Rest (XOR in GF(2))
-            max_len = max(len(product), len(remainder))
-            result = [0] * max_len
-
-            for i in range(max_len):
-                prod_bit = product[i] if i < len(product) else 0
-                rem_bit = remainder[i] if i < len(remainder) else 0
-                result[i] = (prod_bit + rem_bit) % 2
-
-            # Entferne führende Nullen
-            while len(result) > 1 and result[0] == 0:
-                result = result[1:]
-            while len(dividend) > 1 and dividend[0] == 0:
-                dividend = dividend[1:]
+            # Q * G + R (XOR in GF(2)), Strings und Listen werden direkt übernommen
+            kernel = GF2Kernel()
+            product = kernel.mul(kernel.from_bits(quotient), kernel.from_bits(divisor))
+            result = kernel.to_vector(product ^ kernel.from_bits(remainder))
+            dividend = kernel.to_vector(kernel.from_bits(dividend))
 
             # Vergleiche mit ursprünglichem Dividend
             if result == dividend:
@@ -1070,43 +1410,18 @@ class CyclicCodeAnalysisTool(BaseChannelCodingTool):
 
     def polynomial_division_gf2(self, dividend_str, divisor_str):
         """Polynomdivision in GF(2) - kompakte Version"""
-        dividend = [int(bit) for bit in dividend_str]
-        divisor = [int(bit) for bit in divisor_str]
-
-        # Entferne führende Nullen vom Divisor
-        while len(divisor) > 1 and divisor[0] == 0:
-            divisor.pop(0)
-
-        if not divisor or all(bit == 0 for bit in divisor):
+        kernel = GF2Kernel()
+        g = kernel.from_bits(divisor_str)
+        if not g:
             raise ValueError("Divisor = 0")
 
-        if len(dividend) < len(divisor):
-            return "0", "".join(map(str, dividend))
-
-        register = list(dividend)
-        quotient = []
-
-        # Führende Nullen behandeln
-        while register and register[0] == 0 and len(register) >= len(divisor):
-            quotient.append(0)
-            register.pop(0)
-            if not register:
-                break
-
-        # Hauptdivision
-        while len(register) >= len(divisor):
-            if register[0] == 1:
-                quotient.append(1)
-                for i in range(len(divisor)):
-                    register[i] = register[i] ^ divisor[i]  # XOR ohne ^= für MicroPython
-            else:
-                quotient.append(0)
-            register.pop(0)
-
-        remainder_str = "".join(map(str, register))
-        quotient_str = "".join(map(str, quotient)) if quotient else "0"
+        # Breiten wie beim Schieberegister: Quotient len(D) - len(G) + 1, Rest len(G) - 1 Stellen
+        g_len = kernel.degree(g) + 1
+        if len(dividend_str) < g_len:
+            return "0", dividend_str
 
-        return quotient_str, remainder_str
+        q, r = kernel.divide(kernel.from_bits(dividend_str), g)
+        return kernel.to_bits(q, len(dividend_str) - g_len + 1), kernel.to_bits(r, g_len - 1)
 
     def create_parity_matrix_compact(self, generator_poly_str, code_length_n=None):
         """Erstellt Prüfmatrix - kompakte Version mit minimaler Ausgabe"""
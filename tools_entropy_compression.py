@@ -1,5 +1,22 @@
 from tool_base import *
 import math
+import time
+
+try:
+    from collections import Counter
+except ImportError:
+    # MicroPython: kein Counter, Histogramm über bytes.count
+    Counter = None
+
+try:
+    import mmap
+except ImportError:
+    mmap = None
+
+try:
+    from array import array
+except ImportError:
+    array = None
 
 
 class EntropyTool(Tool):
@@ -27,6 +44,241 @@ class EntropyTool(Tool):
         input()
 
 
+class FileEntropyTool(EntropyTool):
+    def byte_histogram(self, chunk, counts=None):
+        """Addiert die Häufigkeit jedes Bytewerts in chunk zu counts (Liste mit 256 Einträgen)"""
+        if counts is None:
+            counts = [0] * 256
+        if Counter is not None:
+            for value, count in Counter(chunk).items():
+                counts[value] += count
+        else:
+            for value in range(256):
+                counts[value] += chunk.count(bytes([value]))
+        return counts
+
+    def iter_file_chunks(self, path, chunk_size=1 << 20):
+        """Liest eine Datei blockweise, über mmap falls verfügbar"""
+        with open(path, "rb") as f:
+            if mmap is not None:
+                f.seek(0, 2)
+                size = f.tell()
+                f.seek(0)
+                if size:
+                    mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    try:
+                        for pos in range(0, size, chunk_size):
+                            yield mapped[pos:pos + chunk_size]
+                    finally:
+                        mapped.close()
+                return
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+
+    def file_entropy(self, path, chunk_size=1 << 20):
+        """Entropie 0. Ordnung der Bytes einer Datei, Redundanz und Huffman-Länge"""
+        start = time.time()
+        counts = [0] * 256
+        for chunk in self.iter_file_chunks(path, chunk_size):
+            self.byte_histogram(chunk, counts)
+        return self.histogram_report(counts, time.time() - start)
+
+    def histogram_report(self, counts, seconds=0.0):
+        """Kennzahlen zu einem Byte-Histogramm"""
+        total = sum(counts)
+        used = [c for c in counts if c]
+        h = self.entropy([c / total for c in used]) if total else 0.0
+        if len(used) > 1:
+            lengths = HuffmanTool().huffman_code_lengths(used)
+            huffman_avg = sum(l * c for l, c in zip(lengths, used)) / total
+        else:
+            huffman_avg = 1.0 if used else 0.0
+        return {
+            'bytes': total,
+            'distinct': len(used),
+            'entropy': h,
+            'h0': 8.0,
+            'redundanz': 8.0 - h,
+            'huffman_avg': huffman_avg,
+            'counts': counts,
+            'seconds': seconds,
+            'mb_per_s': total / 1e6 / seconds if seconds > 0 else 0.0
+        }
+
+    def iter_entropy_profile(self, chunks, window, stride=1):
+        """Entropie über ein gleitendes Fenster von window Bytes, liefert (Offset, H) alle
+        stride Bytes. Pro Byte werden nur die zwei betroffenen Zählerstände und die
+        laufende Summe S = sum(c*log2(c)) angepasst, H = log2(W) - S/W."""
+        if window <= 0 or stride <= 0:
+            raise ValueError("Fenster und Schrittweite müssen positiv sein")
+        clog = [0.0] + [c * math.log2(c) for c in range(1, window + 1)]
+        log_w = math.log2(window)
+        counts = [0] * 256
+        ring = bytearray(window)
+        idx = 0
+        filled = 0
+        consumed = 0
+        s = 0.0
+        for chunk in chunks:
+            for b in chunk:
+                if filled < window:
+                    c = counts[b]
+                    s += clog[c + 1] - clog[c]
+                    counts[b] = c + 1
+                    ring[filled] = b
+                    filled += 1
+                else:
+                    old = ring[idx]
+                    ring[idx] = b
+                    idx += 1
+                    if idx == window:
+                        idx = 0
+                    if old != b:
+                        c = counts[old]
+                        s += clog[c - 1] - clog[c]
+                        counts[old] = c - 1
+                        c = counts[b]
+                        s += clog[c + 1] - clog[c]
+                        counts[b] = c + 1
+                consumed += 1
+                if not consumed & 0xFFFFF:
+                    # Rundungsfehler der laufenden Summe regelmässig verwerfen
+                    s = sum(clog[c] for c in counts)
+                if filled == window and (consumed - window) % stride == 0:
+                    yield consumed - window, log_w - s / window
+
+    def file_entropy_profile(self, path, window=4096, stride=1024, chunk_size=1 << 20):
+        """Lokales Entropieprofil einer Datei als Liste von (Offset, H)"""
+        return list(self.iter_entropy_profile(self.iter_file_chunks(path, chunk_size), window, stride))
+
+    def run(self) -> None:
+        print("==== Datei-Entropie ====")
+        try:
+            path = input("Datei: ").strip()
+            report = self.file_entropy(path)
+            print("\nBytes: {}".format(report['bytes']))
+            print("Verschiedene Bytewerte: {}".format(report['distinct']))
+            print("Entropie: {:.6f} bits/Byte".format(report['entropy']))
+            print("Redundanz (log2(256) - H): {:.6f} bits/Byte".format(report['redundanz']))
+            print("Huffman mittlere Länge: {:.6f} bits/Byte".format(report['huffman_avg']))
+            print("Zeit: {:.3f} s ({:.2f} MB/s)".format(report['seconds'], report['mb_per_s']))
+
+            window_str = input("Fenstergrösse für Profil (leer = kein Profil): ").strip()
+            if window_str:
+                window = int(window_str)
+                stride = int(input("Schrittweite: ").strip())
+                profile = self.file_entropy_profile(path, window, stride)
+                print("\nOffset: H (bits/Byte)")
+                for offset, h in profile[:50]:
+                    print("{}: {:.4f}".format(offset, h))
+                if len(profile) > 50:
+                    print("... {} Werte insgesamt".format(len(profile)))
+                if profile:
+                    values = [h for _, h in profile]
+                    print("Min: {:.4f}  Max: {:.4f}".format(min(values), max(values)))
+        except Exception as e:
+            print("Fehler: {}".format(str(e)))
+
+        print("\nDrücke Enter, um fortzufahren...")
+        input()
+
+
+class CodeTrie(object):
+    """Binärer Trie über Codewörtern ('0'/'1'-Strings), Knoten 0 ist die Wurzel"""
+
+    def __init__(self):
+        self.child0 = [-1]
+        self.child1 = [-1]
+        self.terminal = [-1]
+        self.max_len = 0
+        self.kraft_counts = {}
+
+    def first_terminal_below(self, node):
+        while self.terminal[node] < 0:
+            node = self.child0[node] if self.child0[node] >= 0 else self.child1[node]
+        return self.terminal[node]
+
+    def insert(self, code, index):
+        """Fügt ein Codewort ein, O(Länge). Gibt die Präfixkonflikte als (index, anderer) zurück."""
+        conflicts = []
+        node = 0
+        for ch in code:
+            if self.terminal[node] >= 0:
+                conflicts.append((index, self.terminal[node]))
+            if ch == "0":
+                children = self.child0
+            elif ch == "1":
+                children = self.child1
+            else:
+                raise ValueError("Ungültiges Codewort '{}'".format(code))
+            nxt = children[node]
+            if nxt < 0:
+                nxt = len(self.terminal)
+                children[node] = nxt
+                self.child0.append(-1)
+                self.child1.append(-1)
+                self.terminal.append(-1)
+            node = nxt
+
+        if self.terminal[node] >= 0:
+            conflicts.append((index, self.terminal[node]))
+        elif self.child0[node] >= 0 or self.child1[node] >= 0:
+            conflicts.append((index, self.first_terminal_below(node)))
+        if self.terminal[node] < 0:
+            self.terminal[node] = index
+
+        length = len(code)
+        self.kraft_counts[length] = self.kraft_counts.get(length, 0) + 1
+        if length > self.max_len:
+            self.max_len = length
+        return conflicts
+
+    def kraft(self):
+        """Kraft-Summe sum(2^-l) als gekürzter Bruch (Zähler, Nenner)"""
+        num = 0
+        for length, count in self.kraft_counts.items():
+            num += count << (self.max_len - length)
+        den = 1 << self.max_len
+        while den > 1 and not num & 1:
+            num >>= 1
+            den >>= 1
+        return num, den
+
+    def unused_leaves(self):
+        """Präfixe, die kein Codewort beginnen (fehlende Geschwister im Trie)"""
+        unused = []
+        stack = [(0, "")]
+        while stack:
+            node, prefix = stack.pop()
+            if self.terminal[node] >= 0:
+                continue
+            for bit, child in (("1", self.child1[node]), ("0", self.child0[node])):
+                if child >= 0:
+                    stack.append((child, prefix + bit))
+                elif node or self.child0[0] >= 0 or self.child1[0] >= 0:
+                    unused.append(prefix + bit)
+        unused.sort(key=lambda p: (len(p), p))
+        return unused
+
+    def decode(self, bits):
+        """Dekodiert einen '0'/'1'-String zu einer Liste von Codewort-Indizes"""
+        out = []
+        node = 0
+        for ch in bits:
+            node = self.child1[node] if ch == "1" else self.child0[node]
+            if node < 0:
+                raise ValueError("Ungültige Bitfolge")
+            if self.terminal[node] >= 0:
+                out.append(self.terminal[node])
+                node = 0
+        if node:
+            raise ValueError("Unvollständiges Codewort am Ende")
+        return out
+
+
 class RedundanzTool(Tool):
     def entropy(self, probs):
         """Berechnet die Entropie einer Wahrscheinlichkeitsverteilung"""
@@ -38,6 +290,24 @@ class RedundanzTool(Tool):
         l = sum(p * l for p, l in zip(probs, codewortlängen))
         return l - h  # RC = L - H(X)
 
+    def validate_code(self, codes):
+        """Prüft eine Codetabelle über einen Trie: Präfixkonflikte, Kraft-Summe, ungenutzte Blätter"""
+        trie = CodeTrie()
+        conflicts = []
+        for index, code in enumerate(codes):
+            conflicts.extend(trie.insert(code, index))
+        num, den = trie.kraft()
+        unused = trie.unused_leaves()
+        return {
+            'trie': trie,
+            'prefix_free': not conflicts,
+            'conflicts': conflicts,
+            'kraft': (num, den),
+            'kraft_ok': num <= den,
+            'unused': unused,
+            'complete': num == den and not conflicts
+        }
+
     def run(self) -> None:
         print("==== Redundanz berechnen ====")
         try:
@@ -59,33 +329,422 @@ class RedundanzTool(Tool):
         input()
 
 
+class PrefixCodeTool(RedundanzTool):
+    def run(self) -> None:
+        print("==== Präfixcode prüfen ====")
+        try:
+            n = int(input("Anzahl der Symbole: "))
+            probs = []
+            codes = []
+            for i in range(n):
+                probs.append(float(input("Wahrscheinlichkeit für Symbol {}: ".format(i + 1))))
+                codes.append(input("Codewort für Symbol {}: ".format(i + 1)).strip())
+
+            result = self.validate_code(codes)
+            num, den = result['kraft']
+            print("\nKraft-Summe: {}/{} {}".format(num, den, "<= 1" if result['kraft_ok'] else "> 1 (nicht eindeutig dekodierbar)"))
+            if result['prefix_free']:
+                print("Präfixfrei: ja")
+            else:
+                print("Präfixfrei: nein")
+                for a, b in result['conflicts'][:10]:
+                    print("  {} ({}) <-> {} ({})".format(a + 1, codes[a], b + 1, codes[b]))
+            if result['unused']:
+                print("Ungenutzte Blätter: {}".format(" ".join(result['unused'][:10])))
+            print("Redundanz: {:.6f} bits/Symbol".format(self.redundanz(probs, [len(c) for c in codes])))
+
+            bits = input("Bitfolge dekodieren (leer = nein): ").strip()
+            if bits:
+                decoded = result['trie'].decode(bits)
+                print("Symbole: {}".format(" ".join(str(i + 1) for i in decoded)))
+        except Exception as e:
+            print("Fehler: {}".format(str(e)))
+
+        print("\nDrücke Enter, um fortzufahren...")
+        input()
+
+
+class ShannonFanoTool(RedundanzTool):
+    def decimal_ratio(self, value):
+        """Exakter Bruch (Zähler, Nenner) der Dezimaldarstellung einer Zahl"""
+        text = str(value).lower()
+        exp = 0
+        if "e" in text:
+            text, e = text.split("e")
+            exp = int(e)
+        if "." in text:
+            whole, frac = text.split(".")
+        else:
+            whole, frac = text, ""
+        num = int(whole + frac)
+        exp -= len(frac)
+        if exp >= 0:
+            return num * 10 ** exp, 1
+        return num, 10 ** -exp
+
+    def integer_weights(self, probs):
+        """Ganzzahlige Gewichte mit gemeinsamem Nenner, Verhältnisse exakt wie eingegeben"""
+        for p in probs:
+            if p <= 0:
+                raise ValueError("Wahrscheinlichkeiten müssen positiv sein")
+        ratios = [self.decimal_ratio(p) for p in probs]
+        den = 1
+        for _, d in ratios:
+            if d > den:
+                den = d
+        return [n * (den // d) for n, d in ratios]
+
+    def shannon_fano(self, probs):
+        """Teilt die absteigend sortierten Symbole rekursiv in zwei möglichst gleich
+        wahrscheinliche Hälften, Schnittstelle per Präfixsummen und binärer Suche"""
+        n = len(probs)
+        if n == 1:
+            return ["0"]
+        weights = self.integer_weights(probs)
+        order = sorted(range(n), key=lambda i: -weights[i])
+        prefix = [0]
+        for i in order:
+            prefix.append(prefix[-1] + weights[i])
+
+        codes = [""] * n
+        stack = [(0, n, "")]
+        while stack:
+            lo, hi, code = stack.pop()
+            if hi - lo == 1:
+                codes[order[lo]] = code
+                continue
+            target = prefix[lo] + prefix[hi]
+            # erste Position k mit 2 * prefix[k] >= target
+            a = lo + 1
+            b = hi - 1
+            while a < b:
+                mid = (a + b) // 2
+                if 2 * prefix[mid] >= target:
+                    b = mid
+                else:
+                    a = mid + 1
+            k = a
+            if k > lo + 1 and target - 2 * prefix[k - 1] <= 2 * prefix[k] - target:
+                k -= 1
+            stack.append((k, hi, code + "1"))
+            stack.append((lo, k, code + "0"))
+        return codes
+
+    def shannon_fano_elias(self, probs):
+        """Codewort i: erste l_i Bits von F(i) = sum(p_j, j < i) + p_i / 2,
+        l_i = ceil(log2(1 / p_i)) + 1, alles mit ganzen Zahlen"""
+        weights = self.integer_weights(probs)
+        total = sum(weights)
+        codes = []
+        cumulative = 0
+        for w in weights:
+            # kleinstes l mit w * 2^l >= total
+            length = 0
+            while w << length < total:
+                length += 1
+            length += 1
+            value = ((2 * cumulative + w) << length) // (2 * total)
+            bits = bin(value)[2:]
+            codes.append("0" * (length - len(bits)) + bits)
+            cumulative += w
+        return codes
+
+    def code_report(self, probs, codes):
+        """Mittlere Länge und Redundanz wie bei redundanz(), Wahrscheinlichkeiten normiert"""
+        total = float(sum(probs))
+        probs = [p / total for p in probs]
+        lengths = [len(c) for c in codes]
+        return {
+            'codes': codes,
+            'avg_len': sum(p * l for p, l in zip(probs, lengths)),
+            'redundanz': self.redundanz(probs, lengths)
+        }
+
+    def compare_codes(self, probs):
+        huffman = HuffmanTool()
+        return [
+            ("Shannon-Fano", self.code_report(probs, self.shannon_fano(probs))),
+            ("Shannon-Fano-Elias", self.code_report(probs, self.shannon_fano_elias(probs))),
+            ("Huffman", self.code_report(probs, huffman.canonical_codes(huffman.huffman_code_lengths(probs))))
+        ]
+
+    def run(self) -> None:
+        print("==== Shannon-Fano / Shannon-Fano-Elias ====")
+        try:
+            n = int(input("Anzahl der Symbole: "))
+            probs = []
+            for i in range(n):
+                probs.append(float(input("Wahrscheinlichkeit für Symbol {}: ".format(i + 1))))
+
+            for name, result in self.compare_codes(probs):
+                print("\n{}:".format(name))
+                for i, code in enumerate(result['codes']):
+                    print("{}: {}".format(i + 1, code))
+                print("L = {:.6f}  Redundanz: {:.6f} bits/Symbol".format(result['avg_len'], result['redundanz']))
+        except Exception as e:
+            print("Fehler: {}".format(str(e)))
+
+        print("\nDrücke Enter, um fortzufahren...")
+        input()
+
+
 class HuffmanTool(Tool):
-    def huffman_coding(self, symbols, frequencies):
-        """Erstellt einen Huffman-Code basierend auf Symbolen und Frequenzen"""
-        # Einfache Implementierung für die Prüfung
-        nodes = [[freq, [sym, ""]] for sym, freq in zip(symbols, frequencies)]
-
-        while len(nodes) > 1:
-            # Sortiere nach Frequenz
-            nodes.sort(key=lambda x: x[0])
-            # Nimm die zwei kleinsten Knoten
-            lo = nodes.pop(0)
-            hi = nodes.pop(0)
-
-            # Füge "0" zu allen Codes im lo Knoten hinzu
-            for pair in lo[1:]:
-                pair[1] = "0" + pair[1]
-            # Füge "1" zu allen Codes im hi Knoten hinzu
-            for pair in hi[1:]:
-                pair[1] = "1" + pair[1]
-
-            # Erstelle neuen Knoten mit Summe der Frequenzen
-            nodes.append([lo[0] + hi[0]] + lo[1:] + hi[1:])
-
-        # Extrahiere Codes in ein Dictionary
-        result = [(sym, code) for sym, code in nodes[0][1:]]
-        result.sort(key=lambda t: symbols.index(t[0]))
-        return result
+    def huffman_code_lengths(self, frequencies):
+        """Berechnet die Codewortlängen eines Huffman-Codes in O(n log n)"""
+        n = len(frequencies)
+        if n == 0:
+            return []
+        if n == 1:
+            return [1]
+
+        # Blätter einmal sortieren, danach liefern zwei FIFO-Warteschlangen
+        # (Blätter und innere Knoten) immer die zwei kleinsten Knoten
+        order = sorted(range(n), key=lambda i: frequencies[i])
+        weights = [frequencies[i] for i in order] + [0] * (n - 1)
+        parent = [0] * (2 * n - 1)
+        leaf = 0
+        inner = n
+
+        for node in range(n, 2 * n - 1):
+            children = []
+            for _ in range(2):
+                if leaf < n and (inner >= node or weights[leaf] <= weights[inner]):
+                    children.append(leaf)
+                    leaf += 1
+                else:
+                    children.append(inner)
+                    inner += 1
+            weights[node] = weights[children[0]] + weights[children[1]]
+            parent[children[0]] = node
+            parent[children[1]] = node
+
+        # Eltern haben immer einen höheren Index, daher reicht ein Durchlauf rückwärts
+        depth = [0] * (2 * n - 1)
+        for node in range(2 * n - 3, -1, -1):
+            depth[node] = depth[parent[node]] + 1
+
+        lengths = [0] * n
+        for pos in range(n):
+            lengths[order[pos]] = depth[pos]
+        return lengths
+
+    def canonical_codes(self, lengths):
+        """Weist zu gegebenen Codewortlängen kanonische Codewörter zu"""
+        order = sorted(range(len(lengths)), key=lambda i: (lengths[i], i))
+        codes = [""] * len(lengths)
+        code = 0
+        prev_len = 0
+        for i in order:
+            length = lengths[i]
+            code <<= length - prev_len
+            bits = bin(code)[2:]
+            codes[i] = "0" * (length - len(bits)) + bits
+            code += 1
+            prev_len = length
+        return codes
+
+    def limited_code_lengths(self, frequencies, max_len):
+        """Codewortlängen mit maximaler Länge max_len (Package-Merge)"""
+        n = len(frequencies)
+        if n == 0:
+            return []
+        if n == 1:
+            return [1]
+        if (1 << max_len) < n:
+            raise ValueError("{} Symbole brauchen mindestens Länge {}".format(n, self.min_code_length(n)))
+
+        # Einträge: (Gewicht, Blattindex) oder (Gewicht, (Eintrag, Eintrag)) für Pakete
+        order = sorted(range(n), key=lambda i: frequencies[i])
+        leaves = [(frequencies[i], i) for i in order]
+        current = leaves
+        for _ in range(max_len - 1):
+            packages = []
+            for k in range(0, len(current) - 1, 2):
+                packages.append((current[k][0] + current[k + 1][0], (current[k], current[k + 1])))
+
+            # Blätter und Pakete nach Gewicht zusammenführen (Blätter zuerst bei Gleichstand)
+            merged = []
+            i = 0
+            j = 0
+            while i < n or j < len(packages):
+                if j >= len(packages) or (i < n and leaves[i][0] <= packages[j][0]):
+                    merged.append(leaves[i])
+                    i += 1
+                else:
+                    merged.append(packages[j])
+                    j += 1
+            current = merged
+
+        # Jedes Vorkommen eines Blatts in den 2n-2 leichtesten Einträgen verlängert sein Codewort um 1
+        lengths = [0] * n
+        stack = current[:2 * n - 2]
+        while stack:
+            ref = stack.pop()[1]
+            if isinstance(ref, int):
+                lengths[ref] += 1
+            else:
+                stack.append(ref[0])
+                stack.append(ref[1])
+        return lengths
+
+    def min_code_length(self, n):
+        """Kleinste Länge L mit 2^L >= n"""
+        length = 0
+        while (1 << length) < n:
+            length += 1
+        return length
+
+    def average_length(self, lengths, frequencies):
+        """Mittlere Codewortlänge, Frequenzen werden normiert"""
+        total = sum(frequencies)
+        return sum(l * f for l, f in zip(lengths, frequencies)) / total
+
+    def length_limit_report(self, frequencies, limits):
+        """Mittlere Länge, Mehraufwand und Dekodiertabellengrösse für jede maximale Länge"""
+        free_avg = self.average_length(self.huffman_code_lengths(frequencies), frequencies)
+        report = []
+        for limit in limits:
+            avg = self.average_length(self.limited_code_lengths(frequencies, limit), frequencies)
+            report.append({
+                'max_len': limit,
+                'avg_len': avg,
+                'penalty': avg - free_avg,
+                'table_entries': 1 << limit
+            })
+        return report
+
+    def huffman_coding(self, symbols, frequencies, max_len=None):
+        """Erstellt einen kanonischen Huffman-Code basierend auf Symbolen und Frequenzen"""
+        if max_len is None:
+            lengths = self.huffman_code_lengths(frequencies)
+        else:
+            lengths = self.limited_code_lengths(frequencies, max_len)
+        return list(zip(symbols, self.canonical_codes(lengths)))
+
+    def code_lookup(self, codes):
+        """Erstellt {(Länge, Wert): Symbol} und die maximale Codewortlänge"""
+        lookup = {}
+        max_len = 0
+        for sym, code in codes.items():
+            lookup[(len(code), int(code, 2))] = sym
+            if len(code) > max_len:
+                max_len = len(code)
+        return lookup, max_len
+
+    def decode_prefix(self, lookup, max_len, value, width):
+        """Dekodiert ein Symbol aus den obersten Bits von value (width Bits gültig)"""
+        for length in range(1, min(max_len, width) + 1):
+            sym = lookup.get((length, value >> (width - length)))
+            if sym is not None:
+                return sym, length
+        return None, 0
+
+    def build_decode_table(self, codes, table_bits=8):
+        """Lookup-Tabelle mit 2^table_bits Einträgen, jeder Eintrag löst mehrere Symbole auf"""
+        lookup, max_len = self.code_lookup(codes)
+        table = []
+        for index in range(1 << table_bits):
+            syms = []
+            used = 0
+            while used < table_bits:
+                rest = table_bits - used
+                sym, length = self.decode_prefix(lookup, max_len, index & ((1 << rest) - 1), rest)
+                if sym is None:
+                    break
+                syms.append(sym)
+                used += length
+            table.append((syms, used))
+        return table
+
+    def encode_bits(self, data, codes):
+        """Kodiert data bitweise gepackt, gibt (bytearray, Anzahl Bits) zurück"""
+        table = {sym: (int(code, 2), len(code)) for sym, code in codes.items()}
+        out = bytearray()
+        acc = 0
+        n = 0
+        try:
+            for sym in data:
+                value, length = table[sym]
+                acc = (acc << length) | value
+                n += length
+                if n >= 32:
+                    while n >= 8:
+                        n -= 8
+                        out.append((acc >> n) & 0xFF)
+                    acc &= (1 << n) - 1
+        except KeyError:
+            raise ValueError("Zeichen '{}' unbekannt!".format(sym))
+
+        n_bits = len(out) * 8 + n
+        while n >= 8:
+            n -= 8
+            out.append((acc >> n) & 0xFF)
+        if n:
+            out.append((acc << (8 - n)) & 0xFF)
+        return out, n_bits
+
+    def decode_tables(self, codes, table_bits=8):
+        """Alles, was decode_bits aus codes ableitet, zum Wiederverwenden"""
+        lookup, max_len = self.code_lookup(codes)
+        return self.build_decode_table(codes, table_bits), lookup, max_len, table_bits
+
+    def decode_bits(self, data, n_bits, codes, table_bits=8, tables=None):
+        """Dekodiert n_bits Bits aus data mit einer Mehrsymbol-Lookup-Tabelle"""
+        if tables is None:
+            tables = self.decode_tables(codes, table_bits)
+        table, lookup, max_len, table_bits = tables
+        mask = (1 << table_bits) - 1
+        out = []
+        acc = 0
+        avail = 0
+        pos = 0
+        remaining = n_bits
+
+        while remaining > 0:
+            if remaining >= table_bits:
+                while avail < table_bits:
+                    acc = (acc << 8) | data[pos]
+                    pos += 1
+                    avail += 8
+                syms, used = table[(acc >> (avail - table_bits)) & mask]
+                if used:
+                    out.extend(syms)
+                    avail -= used
+                    remaining -= used
+                    acc &= (1 << avail) - 1
+                    continue
+
+            # Codewort länger als die Tabelle oder Ende des Bitstroms: einzeln dekodieren
+            while avail < max_len and pos < len(data):
+                acc = (acc << 8) | data[pos]
+                pos += 1
+                avail += 8
+            width = min(avail, remaining)
+            sym, used = self.decode_prefix(lookup, max_len, acc >> (avail - width), width)
+            if sym is None:
+                raise ValueError("Ungültige Bitfolge")
+            out.append(sym)
+            avail -= used
+            remaining -= used
+            acc &= (1 << avail) - 1
+
+        return out
+
+    def bits_to_string(self, data, n_bits):
+        """Wandelt gepackte Bits in einen 0/1-String um"""
+        parts = []
+        for byte in data:
+            bits = bin(byte)[2:]
+            parts.append("0" * (8 - len(bits)) + bits)
+        return "".join(parts)[:n_bits]
+
+    def string_to_bits(self, bit_str):
+        """Packt einen 0/1-String in ein bytearray, gibt (bytearray, Anzahl Bits) zurück"""
+        out = bytearray()
+        for i in range(0, len(bit_str), 8):
+            chunk = bit_str[i:i + 8]
+            out.append(int(chunk + "0" * (8 - len(chunk)), 2))
+        return out, len(bit_str)
 
     def run(self) -> None:
         print("==== Huffman-Code erstellen ====")
@@ -99,15 +758,672 @@ class HuffmanTool(Tool):
                 f = float(input("Häufigkeit für Symbol {}: ".format(i + 1)))
                 freqs.append(f)
 
-            huffman_code = self.huffman_coding(symbols, freqs)
+            limit_str = input("Max. Codewortlänge (leer = ohne): ").strip()
+            max_len = int(limit_str) if limit_str else None
+
+            huffman_code = self.huffman_coding(symbols, freqs, max_len)
             print("\nHuffman-Code:")
             for sym, code in huffman_code:
                 print("{}: {}".format(sym, code))
 
             # Calculate average code length
-            avg_length = sum(len(code) * freq for (sym, code), freq in zip(huffman_code, freqs))
+            avg_length = self.average_length([len(code) for sym, code in huffman_code], freqs)
             print("\nDurchschnittliche Codewortlänge: {:.6f} bits/Symbol".format(avg_length))
 
+            if max_len is not None:
+                free_max = max(self.huffman_code_lengths(freqs))
+                limits = range(self.min_code_length(n), max(free_max, max_len) + 1)
+                print("\nL  Mittl. Länge  Mehraufwand  Tabelle")
+                for row in self.length_limit_report(freqs, limits):
+                    print("{:<2} {:<13.6f} {:<12.6f} {}".format(
+                        row['max_len'], row['avg_len'], row['penalty'], row['table_entries']))
+
+        except Exception as e:
+            print("Fehler: {}".format(str(e)))
+
+        print("\nDrücke Enter, um fortzufahren...")
+        input()
+
+
+class HuffmanExtensionTool(HuffmanTool):
+    def extension_classes(self, probs, n):
+        """Liefert für jede Klasse (c_1, ..., c_k) mit Summe n die Wahrscheinlichkeit
+        eines Produktsymbols und die Anzahl Symbole (Multinomialkoeffizient)"""
+        k = len(probs)
+        fact = [1]
+        for i in range(1, n + 1):
+            fact.append(fact[-1] * i)
+        counts = [0] * k
+        counts[0] = n
+
+        while True:
+            prob = 1.0
+            denom = 1
+            for p, c in zip(probs, counts):
+                prob *= p ** c
+                denom *= fact[c]
+            yield tuple(counts), prob, fact[n] // denom
+            # nächste Zerlegung von n in k Teile (absteigend nach c_1)
+            i = k - 2
+            while i >= 0 and counts[i] == 0:
+                i -= 1
+            if i < 0:
+                return
+            counts[i] -= 1
+            rest = counts[k - 1] + 1
+            counts[k - 1] = 0
+            counts[i + 1] = rest
+
+    def grouped_huffman_cost(self, groups):
+        """Mittlere Codewortlänge eines Huffman-Codes über (Gewicht, Anzahl)-Gruppen.
+        Gleich schwere Knoten werden paarweise in einem Schritt zusammengefasst."""
+        # absteigend sortiert, die leichteste Gruppe steht am Ende
+        queue = sorted([list(g) for g in groups if g[1] > 0], reverse=True)
+        total = sum(w * c for w, c in queue)
+        if len(queue) == 1 and queue[0][1] == 1:
+            # wie huffman_code_lengths: ein einzelnes Symbol erhält ein Bit
+            return 1.0
+        cost = 0.0
+
+        def push(weight, count):
+            lo = 0
+            hi = len(queue)
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if queue[mid][0] > weight:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            if lo < len(queue) and queue[lo][0] == weight:
+                queue[lo][1] += count
+            else:
+                queue.insert(lo, [weight, count])
+
+        while queue:
+            weight, count = queue.pop()
+            if count >= 2:
+                pairs = count // 2
+                cost += pairs * 2 * weight
+                if count & 1:
+                    queue.append([weight, 1])
+                push(2 * weight, pairs)
+            elif queue:
+                other = queue[-1]
+                other[1] -= 1
+                if not other[1]:
+                    queue.pop()
+                cost += weight + other[0]
+                push(weight + other[0], 1)
+        return cost / total if total else 0.0
+
+    def extension_report(self, probs, max_n):
+        """Mittlere Länge pro Quellensymbol und Redundanz für die Erweiterungen 1..max_n"""
+        total = float(sum(probs))
+        probs = [p / total for p in probs]
+        h = EntropyTool().entropy(probs)
+        report = []
+        for n in range(1, max_n + 1):
+            start = time.time()
+            groups = [(prob, mult) for _, prob, mult in self.extension_classes(probs, n)]
+            avg = self.grouped_huffman_cost(groups) / n
+            report.append({
+                'n': n,
+                'classes': len(groups),
+                'symbols': len(probs) ** n,
+                'avg_len': avg,
+                'redundanz': avg - h,
+                'seconds': time.time() - start
+            })
+        return h, report
+
+    def run(self) -> None:
+        print("==== Huffman für Quellenerweiterung ====")
+        try:
+            k = int(input("Anzahl der Symbole: "))
+            probs = []
+            for i in range(k):
+                probs.append(float(input("Wahrscheinlichkeit für Symbol {}: ".format(i + 1))))
+            max_n = int(input("Max. Erweiterung n: "))
+
+            h, report = self.extension_report(probs, max_n)
+            print("\nEntropie: {:.6f} bits/Symbol".format(h))
+            print("n  Klassen  L/n       Redundanz")
+            for row in report:
+                print("{:<2} {:<8} {:<9.6f} {:.6f}".format(row['n'], row['classes'], row['avg_len'], row['redundanz']))
+
+        except Exception as e:
+            print("Fehler: {}".format(str(e)))
+
+        print("\nDrücke Enter, um fortzufahren...")
+        input()
+
+
+class RangeCoderTool(Tool):
+    PROB_BITS = 12
+    TOP = 1 << 24
+
+    def quantize(self, probs, prob_bits=PROB_BITS):
+        """Rundet Wahrscheinlichkeiten auf ganzzahlige Häufigkeiten mit Summe 2^prob_bits (jede >= 1)"""
+        total = 1 << prob_bits
+        if len(probs) > total:
+            raise ValueError("Zu viele Symbole für {} Bit".format(prob_bits))
+        weight = float(sum(probs))
+        freqs = [max(1, int(p / weight * total + 0.5)) for p in probs]
+        diff = total - sum(freqs)
+        while diff:
+            # Differenz beim jeweils grössten Symbol ausgleichen
+            i = freqs.index(max(freqs))
+            step = diff if diff > 0 else max(diff, 1 - freqs[i])
+            freqs[i] += step
+            diff -= step
+        return freqs
+
+    def cumulative(self, freqs):
+        cum = [0]
+        for f in freqs:
+            cum.append(cum[-1] + f)
+        return cum
+
+    def range_encode(self, message, freqs, prob_bits=PROB_BITS):
+        """Kodiert eine Folge von Symbolindizes, nur Ganzzahlarithmetik (32 Bit mit Übertrag)"""
+        cum = self.cumulative(freqs)
+        top = self.TOP
+        out = bytearray()
+        low = 0
+        rng = 0xFFFFFFFF
+        cache = 0
+        cache_size = 1
+
+        for sym in list(message) + [None] * 5:
+            if sym is not None:
+                r = rng >> prob_bits
+                low += r * cum[sym]
+                rng = r * freqs[sym]
+                if rng >= top:
+                    continue
+            # Normalisieren: oberstes Byte ausgeben, Übertrag über wartende 0xFF-Bytes
+            while True:
+                if low < 0xFF000000 or low > 0xFFFFFFFF:
+                    carry = low >> 32
+                    temp = cache
+                    while cache_size:
+                        out.append((temp + carry) & 0xFF)
+                        temp = 0xFF
+                        cache_size -= 1
+                    cache = (low >> 24) & 0xFF
+                cache_size += 1
+                low = (low << 8) & 0xFFFFFFFF
+                rng <<= 8
+                if sym is None or rng >= top:
+                    break
+        return out
+
+    def range_decode(self, data, n, freqs, prob_bits=PROB_BITS):
+        """Dekodiert n Symbolindizes, Symbolsuche über eine Tabelle mit 2^prob_bits Einträgen"""
+        cum = self.cumulative(freqs)
+        lookup = []
+        for sym in range(len(freqs)):
+            lookup.extend([sym] * freqs[sym])
+        top = self.TOP
+        total = 1 << prob_bits
+
+        pos = 1
+        code = 0
+        for _ in range(4):
+            code = (code << 8) | (data[pos] if pos < len(data) else 0)
+            pos += 1
+        rng = 0xFFFFFFFF
+
+        result = []
+        for _ in range(n):
+            r = rng >> prob_bits
+            value = code // r
+            sym = lookup[value if value < total else total - 1]
+            code -= r * cum[sym]
+            rng = r * freqs[sym]
+            while rng < top:
+                code = ((code << 8) | (data[pos] if pos < len(data) else 0)) & 0xFFFFFFFF
+                pos += 1
+                rng <<= 8
+            result.append(sym)
+        return result
+
+    def sample_message(self, freqs):
+        """Beispielnachricht, in der jedes Symbol genau so oft vorkommt wie seine Häufigkeit"""
+        total = sum(freqs)
+        keyed = []
+        for sym in range(len(freqs)):
+            for k in range(freqs[sym]):
+                keyed.append(((2 * k + 1) * total // (2 * freqs[sym]), sym))
+        keyed.sort()
+        return [sym for _, sym in keyed]
+
+    def compare(self, probs, message, prob_bits=PROB_BITS):
+        """Erreichte Bits/Symbol des Range Coders im Vergleich zu Entropie und Huffman"""
+        freqs = self.quantize(probs, prob_bits)
+        encoded = self.range_encode(message, freqs, prob_bits)
+        if self.range_decode(encoded, len(message), freqs, prob_bits) != list(message):
+            raise ValueError("Dekodierung stimmt nicht!")
+        weight = float(sum(probs))
+        huffman = HuffmanTool()
+        return {
+            'bytes': len(encoded),
+            'bits_per_symbol': 8.0 * len(encoded) / len(message) if message else 0.0,
+            'entropy': EntropyTool().entropy([p / weight for p in probs]),
+            'huffman_avg': huffman.average_length(huffman.huffman_code_lengths(probs), probs),
+            'freqs': freqs
+        }
+
+    def run(self) -> None:
+        print("==== Range Coder ====")
+        try:
+            n = int(input("Anzahl der Symbole: "))
+            symbols = []
+            probs = []
+            for i in range(n):
+                s = input("Symbol {}: ".format(i + 1))
+                symbols.append(s)
+                p = float(input("Häufigkeit für Symbol {}: ".format(i + 1)))
+                probs.append(p)
+
+            msg = input("Nachricht (leer = Beispiel): ")
+            if msg:
+                tokens = msg.split() if any(len(s) != 1 for s in symbols) else list(msg)
+                message = [symbols.index(t) for t in tokens]
+            else:
+                message = self.sample_message(self.quantize(probs))
+
+            result = self.compare(probs, message)
+            print("\nSymbole: {}".format(len(message)))
+            print("Kodiert: {} Bytes".format(result['bytes']))
+            print("Range Coder: {:.6f} bits/Symbol".format(result['bits_per_symbol']))
+            print("Entropie: {:.6f} bits/Symbol".format(result['entropy']))
+            print("Huffman: {:.6f} bits/Symbol".format(result['huffman_avg']))
+
+        except Exception as e:
+            print("Fehler: {}".format(str(e)))
+
+        print("\nDrücke Enter, um fortzufahren...")
+        input()
+
+
+class TunstallTool(Tool):
+    def heap_push(self, heap, item):
+        """Max-Heap als Liste (heapq gibt es auf dem Rechner nicht)"""
+        heap.append(item)
+        i = len(heap) - 1
+        while i:
+            parent = (i - 1) // 2
+            if heap[parent] >= heap[i]:
+                break
+            heap[parent], heap[i] = heap[i], heap[parent]
+            i = parent
+
+    def heap_pop(self, heap):
+        top = heap[0]
+        last = heap.pop()
+        if heap:
+            heap[0] = last
+            n = len(heap)
+            i = 0
+            while True:
+                child = 2 * i + 1
+                if child >= n:
+                    break
+                if child + 1 < n and heap[child + 1] > heap[child]:
+                    child += 1
+                if heap[i] >= heap[child]:
+                    break
+                heap[i], heap[child] = heap[child], heap[i]
+                i = child
+        return top
+
+    def tunstall_tree(self, probs, bits):
+        """Baut den Parse-Baum: das wahrscheinlichste Blatt wird erweitert, solange höchstens 2^bits Blätter entstehen"""
+        k = len(probs)
+        if k < 2:
+            raise ValueError("Mindestens 2 Symbole")
+        if k > 1 << bits:
+            raise ValueError("2^{} < Anzahl Symbole".format(bits))
+        total = float(sum(probs))
+        probs = [p / total for p in probs]
+
+        children = [None]
+        prob = [1.0]
+        depth = [0]
+        parent = [-1]
+        symbol = [-1]
+        heap = []
+
+        def expand(node):
+            ids = []
+            for sym in range(k):
+                child = len(children)
+                children.append(None)
+                prob.append(prob[node] * probs[sym])
+                depth.append(depth[node] + 1)
+                parent.append(node)
+                symbol.append(sym)
+                ids.append(child)
+                # bei gleicher Wahrscheinlichkeit zuerst der ältere Knoten
+                self.heap_push(heap, (prob[child], -child))
+            children[node] = ids
+
+        expand(0)
+        leaves = k
+        while leaves + k - 1 <= 1 << bits:
+            _, node = self.heap_pop(heap)
+            expand(-node)
+            leaves += k - 1
+
+        code = [-1] * len(children)
+        phrases = []
+        expected_len = 0.0
+        for node in range(len(children)):
+            if children[node] is None:
+                code[node] = len(phrases)
+                phrase = []
+                leaf = node
+                while leaf:
+                    phrase.append(symbol[leaf])
+                    leaf = parent[leaf]
+                phrase.reverse()
+                phrases.append(phrase)
+                expected_len += prob[node] * depth[node]
+        return {'children': children, 'code': code, 'phrases': phrases, 'expected_len': expected_len}
+
+    def tunstall_encode(self, message, tree, bits):
+        """Zerlegt message (Symbolindizes) per Trie-Lauf in Phrasen, je ein bits-Bit-Wort.
+        Gibt (bytearray, Anzahl Wörter) zurück, ein angefangener Rest wird zu einem Blatt ergänzt."""
+        children = tree['children']
+        code = tree['code']
+        out = bytearray()
+        acc = 0
+        n_acc = 0
+        words = 0
+        node = 0
+        for sym in message:
+            node = children[node][sym]
+            if children[node] is None:
+                acc = (acc << bits) | code[node]
+                n_acc += bits
+                words += 1
+                while n_acc >= 8:
+                    n_acc -= 8
+                    out.append((acc >> n_acc) & 0xFF)
+                acc &= (1 << n_acc) - 1
+                node = 0
+        if node:
+            while children[node] is not None:
+                node = children[node][0]
+            acc = (acc << bits) | code[node]
+            n_acc += bits
+            words += 1
+        while n_acc >= 8:
+            n_acc -= 8
+            out.append((acc >> n_acc) & 0xFF)
+        if n_acc:
+            out.append((acc << (8 - n_acc)) & 0xFF)
+        return out, words
+
+    def tunstall_decode(self, data, words, n, tree, bits):
+        """Liest words Wörter, gibt die ersten n Symbolindizes zurück"""
+        phrases = tree['phrases']
+        mask = (1 << bits) - 1
+        out = []
+        acc = 0
+        n_acc = 0
+        pos = 0
+        for _ in range(words):
+            while n_acc < bits:
+                acc = (acc << 8) | data[pos]
+                pos += 1
+                n_acc += 8
+            n_acc -= bits
+            out.extend(phrases[(acc >> n_acc) & mask])
+            acc &= (1 << n_acc) - 1
+        return out[:n]
+
+    def tunstall_report(self, probs, message, bits):
+        tree = self.tunstall_tree(probs, bits)
+        encoded, words = self.tunstall_encode(message, tree, bits)
+        if self.tunstall_decode(encoded, words, len(message), tree, bits) != list(message):
+            raise ValueError("Dekodierung stimmt nicht!")
+        total = float(sum(probs))
+        return {
+            'leaves': len(tree['phrases']),
+            'words': words,
+            'bits_per_symbol': bits * words / float(len(message)) if message else 0.0,
+            'expected': bits / tree['expected_len'],
+            'entropy': EntropyTool().entropy([p / total for p in probs]),
+            'tree': tree
+        }
+
+    def run(self) -> None:
+        print("==== Tunstall-Code ====")
+        try:
+            n = int(input("Anzahl der Symbole: "))
+            symbols = []
+            probs = []
+            for i in range(n):
+                symbols.append(input("Symbol {}: ".format(i + 1)))
+                probs.append(float(input("Häufigkeit für Symbol {}: ".format(i + 1))))
+            bits = int(input("Wortbreite b: "))
+
+            msg = input("Nachricht (leer = Beispiel): ")
+            if msg:
+                tokens = msg.split() if any(len(s) != 1 for s in symbols) else list(msg)
+                message = [symbols.index(t) for t in tokens]
+            else:
+                coder = RangeCoderTool()
+                message = coder.sample_message(coder.quantize(probs))
+
+            result = self.tunstall_report(probs, message, bits)
+            if result['leaves'] <= 16:
+                print("\nTunstall-Wörterbuch:")
+                for word, phrase in enumerate(result['tree']['phrases']):
+                    bits_str = bin(word)[2:]
+                    print("{}: {}".format("".join(symbols[s] for s in phrase), "0" * (bits - len(bits_str)) + bits_str))
+            print("\nSymbole: {}  Wörter: {}".format(len(message), result['words']))
+            print("Tunstall: {:.6f} bits/Symbol".format(result['bits_per_symbol']))
+            print("Erwartet: {:.6f} bits/Symbol".format(result['expected']))
+            print("Entropie: {:.6f} bits/Symbol".format(result['entropy']))
+
+        except Exception as e:
+            print("Fehler: {}".format(str(e)))
+
+        print("\nDrücke Enter, um fortzufahren...")
+        input()
+
+
+class AdaptiveHuffmanTree(object):
+    """FGK-Baum, Knoten stehen nach ihrer Nummer (Geschwister-Eigenschaft) in Listen"""
+
+    def __init__(self, alphabet=256):
+        size = 2 * alphabet + 1
+        self.root = size - 1
+        self.nyt = self.root
+        self.weight = [0] * size
+        self.parent = [-1] * size
+        self.child0 = [-1] * size
+        self.child1 = [-1] * size
+        self.symbol = [-1] * size
+        self.leaf = {}
+        # höchste Knotennummer pro Gewicht (Blockführer)
+        self.leader = {}
+
+    def code(self, node):
+        """Codewort (Wert, Länge) eines Knotens, vom Blatt zur Wurzel gelesen"""
+        value = 0
+        length = 0
+        while node != self.root:
+            p = self.parent[node]
+            if self.child1[p] == node:
+                value |= 1 << length
+            length += 1
+            node = p
+        return value, length
+
+    def swap(self, a, b):
+        """Tauscht die Teilbäume an den Nummern a und b (gleiches Gewicht)"""
+        for nodes in (self.symbol, self.child0, self.child1):
+            nodes[a], nodes[b] = nodes[b], nodes[a]
+        for node in (a, b):
+            if self.child0[node] >= 0:
+                self.parent[self.child0[node]] = node
+                self.parent[self.child1[node]] = node
+            elif self.symbol[node] >= 0:
+                self.leaf[self.symbol[node]] = node
+
+    def update(self, sym):
+        """Erhöht das Gewicht von sym, O(Codewortlänge)"""
+        if sym in self.leaf:
+            node = self.leaf[sym]
+        else:
+            # NYT-Knoten aufteilen: links neuer NYT, rechts das neue Blatt
+            z = self.nyt
+            self.child0[z] = z - 2
+            self.child1[z] = z - 1
+            self.parent[z - 2] = z
+            self.parent[z - 1] = z
+            self.symbol[z - 1] = sym
+            self.leaf[sym] = z - 1
+            self.nyt = z - 2
+            node = z - 1
+
+        weight = self.weight
+        leader = self.leader
+        while True:
+            w = weight[node]
+            lead = leader.get(w, node)
+            if lead > node and lead != self.parent[node]:
+                self.swap(node, lead)
+                node = lead
+            if leader.get(w) == node:
+                if weight[node - 1] == w:
+                    leader[w] = node - 1
+                else:
+                    del leader[w]
+            weight[node] = w + 1
+            if leader.get(w + 1, -1) < node:
+                leader[w + 1] = node
+            if node == self.root:
+                break
+            node = self.parent[node]
+
+
+class AdaptiveHuffmanTool(Tool):
+    SYMBOL_BITS = 8
+
+    def adaptive_encode_stream(self, chunks, stats=None):
+        """Kodiert Byte-Blöcke in einem Durchgang, liefert pro Block die fertigen Bytes"""
+        tree = AdaptiveHuffmanTree(1 << self.SYMBOL_BITS)
+        acc = 0
+        n_acc = 0
+        total_bits = 0
+        count = 0
+        for chunk in chunks:
+            out = bytearray()
+            for sym in chunk:
+                if sym in tree.leaf:
+                    value, length = tree.code(tree.leaf[sym])
+                else:
+                    # neues Symbol: NYT-Code, danach das Symbol unkodiert
+                    value, length = tree.code(tree.nyt)
+                    value = (value << self.SYMBOL_BITS) | sym
+                    length += self.SYMBOL_BITS
+                tree.update(sym)
+                acc = (acc << length) | value
+                n_acc += length
+                total_bits += length
+                while n_acc >= 8:
+                    n_acc -= 8
+                    out.append((acc >> n_acc) & 0xFF)
+                acc &= (1 << n_acc) - 1
+            count += len(chunk)
+            if out:
+                yield bytes(out)
+        if n_acc:
+            yield bytes([(acc << (8 - n_acc)) & 0xFF])
+        if stats is not None:
+            stats['symbols'] = count
+            stats['bits'] = total_bits
+
+    def adaptive_encode(self, data):
+        """Gibt (bytes, Anzahl Bits) zurück"""
+        stats = {}
+        encoded = b"".join(self.adaptive_encode_stream([data], stats))
+        return encoded, stats['bits']
+
+    def adaptive_decode_stream(self, chunks, n_symbols):
+        """Dekodiert n_symbols Bytes aus den Blöcken, baut den Baum genau wie der Kodierer nach"""
+        tree = AdaptiveHuffmanTree(1 << self.SYMBOL_BITS)
+        node = tree.root
+        remaining = n_symbols
+        raw = self.SYMBOL_BITS if remaining else 0
+        value = 0
+        for chunk in chunks:
+            out = bytearray()
+            for byte in chunk:
+                for shift in range(7, -1, -1):
+                    if not remaining:
+                        break
+                    bit = (byte >> shift) & 1
+                    if raw:
+                        value = (value << 1) | bit
+                        raw -= 1
+                        if raw:
+                            continue
+                        sym = value
+                    else:
+                        node = tree.child1[node] if bit else tree.child0[node]
+                        if node == tree.nyt:
+                            raw = self.SYMBOL_BITS
+                            value = 0
+                            continue
+                        sym = tree.symbol[node]
+                        if sym < 0:
+                            continue
+                    out.append(sym)
+                    tree.update(sym)
+                    remaining -= 1
+                    node = tree.root
+            if out:
+                yield bytes(out)
+
+    def adaptive_decode(self, data, n_symbols):
+        return b"".join(self.adaptive_decode_stream([data], n_symbols))
+
+    def adaptive_report(self, data):
+        """Vergleicht die adaptive Kodierung mit statischem (zweimal gelesenem) Huffman"""
+        encoded, n_bits = self.adaptive_encode(data)
+        if self.adaptive_decode(encoded, len(data)) != bytes(data):
+            raise ValueError("Dekodierung stimmt nicht!")
+        counts = [c for c in FileEntropyTool().byte_histogram(data) if c]
+        lengths = HuffmanTool().huffman_code_lengths(counts)
+        static_bits = sum(l * c for l, c in zip(lengths, counts))
+        n = len(data)
+        return {
+            'symbols': n,
+            'encoded': encoded,
+            'adaptive_bits': n_bits,
+            'static_bits': static_bits,
+            'adaptive_avg': n_bits / n if n else 0.0,
+            'static_avg': static_bits / n if n else 0.0,
+            'overhead': 100.0 * (n_bits - static_bits) / static_bits if static_bits else 0.0
+        }
+
+    def run(self) -> None:
+        print("==== Adaptiver Huffman (FGK) ====")
+        try:
+            text = input("Text: ")
+            result = self.adaptive_report(text.encode())
+            if result['adaptive_bits'] <= 64:
+                print("Bitfolge: {}".format(HuffmanTool().bits_to_string(result['encoded'], result['adaptive_bits'])))
+            print("Symbole: {}".format(result['symbols']))
+            print("Adaptiv: {} Bits ({:.4f} bits/Symbol)".format(result['adaptive_bits'], result['adaptive_avg']))
+            print("Statisch: {} Bits ({:.4f} bits/Symbol)".format(result['static_bits'], result['static_avg']))
+            print("Mehraufwand: {:.2f} %".format(result['overhead']))
         except Exception as e:
             print("Fehler: {}".format(str(e)))
 
@@ -116,27 +1432,177 @@ class HuffmanTool(Tool):
 
 
 class RLETool(Tool):
+    def rle_run_length(self, data, pos, end):
+        """Länge des Laufs ab pos, blockweise mit lstrip statt Element für Element"""
+        if not isinstance(data, (str, bytes, bytearray, memoryview)):
+            # Listen, Tupel usw.: kein lstrip, Element für Element vergleichen
+            sym = data[pos]
+            stop = pos + 1
+            while stop < end and data[stop] == sym:
+                stop += 1
+            return stop - pos
+        sym = data[pos:pos + 1]
+        if isinstance(data, memoryview):
+            sym = bytes(sym)
+        stop = pos
+        width = 16
+        while stop < end:
+            block_end = min(end, stop + width)
+            block = data[stop:block_end]
+            if isinstance(block, memoryview):
+                block = bytes(block)
+            rest = len(block.lstrip(sym))
+            stop = block_end - rest
+            if rest:
+                break
+            width *= 2
+        return stop - pos
+
+    def rle_iter_runs(self, chunks):
+        """Liefert (Symbol, Anzahl) für eine Folge von Blöcken (str, bytes, bytearray, memoryview).
+        Läufe über Blockgrenzen hinweg werden zusammengefasst."""
+        prev = None
+        count = 0
+        for chunk in chunks:
+            pos = 0
+            n = len(chunk)
+            while pos < n:
+                sym = chunk[pos]
+                length = self.rle_run_length(chunk, pos, n)
+                if sym == prev:
+                    count += length
+                else:
+                    if count:
+                        yield prev, count
+                    prev = sym
+                    count = length
+                pos += length
+        if count:
+            yield prev, count
+
     def rle_encode(self, data):
-        if len(data) == 0:
-            return [], 0
-        encoded = []
-        prev = data[0]
-        count = 1
-        for i in range(1, len(data)):
-            if data[i] == prev:
-                count += 1
-            else:
-                encoded.append((prev, count))
-                prev = data[i]
-                count = 1
-        encoded.append((prev, count))
+        encoded = list(self.rle_iter_runs([data]))
         return encoded, len(encoded)
 
-    def rle_decode(self, encoded):
-        output = ''
+    def rle_iter_decode(self, encoded, chunk_size=65536):
+        """Dekodiert (Symbol, Anzahl)-Paare blockweise, Symbole als Zeichen (str) oder Bytewerte (int)"""
+        parts = []
+        size = 0
         for sym, cnt in encoded:
-            output += sym * cnt
-        return output
+            parts.append(bytes([sym]) * cnt if isinstance(sym, int) else sym * cnt)
+            size += cnt
+            if size >= chunk_size:
+                yield parts[0][:0].join(parts)
+                parts = []
+                size = 0
+        if parts:
+            yield parts[0][:0].join(parts)
+
+    def rle_decode(self, encoded):
+        chunks = list(self.rle_iter_decode(encoded))
+        return chunks[0][:0].join(chunks) if chunks else ''
+
+    def bit_run_table(self):
+        """Für jeden Bytewert die Bitläufe (Bit, Länge), MSB zuerst"""
+        table = []
+        for byte in range(256):
+            runs = []
+            for shift in range(7, -1, -1):
+                bit = (byte >> shift) & 1
+                if runs and runs[-1][0] == bit:
+                    runs[-1][1] += 1
+                else:
+                    runs.append([bit, 1])
+            table.append(runs)
+        return table
+
+    def rle_iter_bit_pieces(self, chunks):
+        """Liefert (Bit, Länge)-Stücke aus bitgepackten Bytes oder '0'/'1'-Strings"""
+        table = None
+        for chunk in chunks:
+            if isinstance(chunk, str):
+                for sym, cnt in self.rle_iter_runs([chunk]):
+                    yield int(sym), cnt
+                continue
+            if table is None:
+                table = self.bit_run_table()
+            pos = 0
+            n = len(chunk)
+            while pos < n:
+                byte = chunk[pos]
+                if byte == 0 or byte == 255:
+                    # Ganze 0x00/0xFF-Bytes am Stück
+                    length = self.rle_run_length(chunk, pos, n)
+                    yield byte & 1, length * 8
+                    pos += length
+                else:
+                    for bit, length in table[byte]:
+                        yield bit, length
+                    pos += 1
+
+    def rle_iter_bit_runs(self, chunks, start_with=0):
+        """Lauflängen abwechselnder Bitläufe, die erste Länge gehört zu start_with (ggf. 0)"""
+        bit = start_with
+        count = 0
+        seen = False
+        for run_bit, length in self.rle_iter_bit_pieces(chunks):
+            seen = True
+            if run_bit == bit:
+                count += length
+            else:
+                yield count
+                bit = run_bit
+                count = length
+        if seen:
+            yield count
+
+    def rle_iter_bit_decode(self, lengths, start_with=0, packed=True, chunk_size=65536):
+        """Erzeugt aus abwechselnden Lauflängen bitgepackte Bytes (MSB zuerst, letztes Byte
+        mit Nullen aufgefüllt) oder mit packed=False einen '0'/'1'-String, blockweise"""
+        bit = start_with
+        if not packed:
+            parts = []
+            size = 0
+            for length in lengths:
+                parts.append("01"[bit] * length)
+                size += length
+                bit ^= 1
+                if size >= chunk_size:
+                    yield "".join(parts)
+                    parts = []
+                    size = 0
+            if parts:
+                yield "".join(parts)
+            return
+
+        out = bytearray()
+        acc = 0
+        n = 0
+        for length in lengths:
+            if n:
+                # Angefangenes Byte auffüllen
+                take = min(length, 8 - n)
+                acc = (acc << take) | (((1 << take) - 1) if bit else 0)
+                n += take
+                length -= take
+                if n == 8:
+                    out.append(acc)
+                    acc = 0
+                    n = 0
+            if length >= 8:
+                out.extend((b"\xff" if bit else b"\x00") * (length >> 3))
+                length &= 7
+            if length:
+                acc = ((1 << length) - 1) if bit else 0
+                n = length
+            bit ^= 1
+            if len(out) >= chunk_size:
+                yield bytes(out)
+                out = bytearray()
+        if n:
+            out.append((acc << (8 - n)) & 0xFF)
+        if out:
+            yield bytes(out)
 
     def menu(self):
         print("==== Lauflängenkodierung (RLE) ====")
@@ -195,6 +1661,10 @@ class RLETool(Tool):
             print("Original:", original_len, "Einheiten")
             print("Kodiert:", encoded_len, "Einheiten")
 
+            if choice == 2:
+                runs = list(self.rle_iter_bit_runs([s]))
+                print("Bitläufe (ab 0):", " ".join(str(r) for r in runs))
+
             decoded = self.rle_decode(encoded)
             print("Überprüfung:", end=' ')
             if decoded == s:
@@ -205,97 +1675,1001 @@ class RLETool(Tool):
             print("Drücke Enter zum Fortfahren...")
             input()  # Wartet auf Enter
 
+class BWTTool(Tool):
+    STAGES = ("BWT", "MTF", "RLE", "Huffman")
+
+    def counting_sort(self, items, keys, n_keys):
+        """Stabile Sortierung von items nach keys[item] (Werte 0..n_keys-1)"""
+        start = [0] * (n_keys + 1)
+        for i in items:
+            start[keys[i] + 1] += 1
+        for v in range(n_keys):
+            start[v + 1] += start[v]
+        out = [0] * len(items)
+        for i in items:
+            k = keys[i]
+            out[start[k]] = i
+            start[k] += 1
+        return out
+
+    def suffix_array(self, data):
+        """Suffix-Array durch Präfixverdopplung mit Zählsortierung, O(n log n)"""
+        n = len(data)
+        if n == 0:
+            return []
+        sa = self.counting_sort(range(n), data, 256)
+        rank = [0] * n
+        r = 0
+        for j in range(1, n):
+            if data[sa[j]] != data[sa[j - 1]]:
+                r += 1
+            rank[sa[j]] = r
+
+        k = 1
+        while r < n - 1:
+            # nach zweiter Hälfte sortiert: Suffixe ohne zweite Hälfte zuerst, dann Reihenfolge aus sa
+            second = list(range(n - k, n)) + [p - k for p in sa if p >= k]
+            sa = self.counting_sort(second, rank, r + 1)
+            new_rank = [0] * n
+            r = 0
+            prev = sa[0]
+            prev_key = rank[prev + k] if prev + k < n else -1
+            for j in range(1, n):
+                cur = sa[j]
+                cur_key = rank[cur + k] if cur + k < n else -1
+                if rank[cur] != rank[prev] or cur_key != prev_key:
+                    r += 1
+                new_rank[cur] = r
+                prev = cur
+                prev_key = cur_key
+            rank = new_rank
+            k <<= 1
+        return sa
+
+    def bwt(self, block):
+        """Gibt (letzte Spalte ohne Endmarke, Zeile der Endmarke) zurück"""
+        n = len(block)
+        if n == 0:
+            return b"", 0
+        # Zeile 0 ist das leere Suffix, davor steht das letzte Zeichen
+        last = bytearray([block[n - 1]])
+        primary = 0
+        for p in self.suffix_array(block):
+            if p:
+                last.append(block[p - 1])
+            else:
+                primary = len(last)
+        return bytes(last), primary
+
+    def inverse_bwt(self, last, primary):
+        n = len(last)
+        column = list(last)
+        column.insert(primary, -1)
+        counts = [0] * 256
+        for c in last:
+            counts[c] += 1
+        start = [0] * 256
+        total = 1
+        for c in range(256):
+            start[c] = total
+            total += counts[c]
+        lf = [0] * (n + 1)
+        for row in range(n + 1):
+            c = column[row]
+            if c >= 0:
+                lf[row] = start[c]
+                start[c] += 1
+        out = bytearray(n)
+        row = 0
+        for k in range(n - 1, -1, -1):
+            out[k] = column[row]
+            row = lf[row]
+        return bytes(out)
+
+    def mtf_encode(self, data):
+        table = list(range(256))
+        out = bytearray(len(data))
+        for i in range(len(data)):
+            c = data[i]
+            j = table.index(c)
+            out[i] = j
+            if j:
+                del table[j]
+                table.insert(0, c)
+        return bytes(out)
+
+    def mtf_decode(self, data):
+        table = list(range(256))
+        out = bytearray(len(data))
+        for i in range(len(data)):
+            j = data[i]
+            c = table[j]
+            out[i] = c
+            if j:
+                del table[j]
+                table.insert(0, c)
+        return bytes(out)
+
+    def rle_pack(self, data):
+        """Läufe als Bytepaare (Symbol, Anzahl - 1), längere Läufe werden aufgeteilt"""
+        out = bytearray()
+        for sym, count in RLETool().rle_iter_runs([data]):
+            while count:
+                take = min(count, 256)
+                out.append(sym)
+                out.append(take - 1)
+                count -= take
+        return bytes(out)
+
+    def rle_unpack(self, data):
+        return bytes(RLETool().rle_decode([(data[i], data[i + 1] + 1) for i in range(0, len(data), 2)]))
+
+    def huffman_pack(self, data):
+        """Gibt (Codetabelle als (Symbol, Länge)-Paare, gepackte Bits, Anzahl Bits) zurück"""
+        counts = FileEntropyTool().byte_histogram(data)
+        used = [sym for sym in range(256) if counts[sym]]
+        huffman = HuffmanTool()
+        lengths = huffman.huffman_code_lengths([counts[sym] for sym in used])
+        table = bytearray()
+        for sym, length in zip(used, lengths):
+            table.append(sym)
+            table.append(length)
+        codes = dict(zip(used, huffman.canonical_codes(lengths)))
+        packed, n_bits = huffman.encode_bits(data, codes)
+        return bytes(table), bytes(packed), n_bits
+
+    def huffman_unpack(self, table, packed, n_bits):
+        used = [table[i] for i in range(0, len(table), 2)]
+        lengths = [table[i] for i in range(1, len(table), 2)]
+        codes = dict(zip(used, HuffmanTool().canonical_codes(lengths)))
+        return bytes(HuffmanTool().decode_bits(packed, n_bits, codes))
+
+    def stage_stats(self, stats, name):
+        if name not in stats:
+            stats[name] = {'in_bytes': 0, 'out_bytes': 0, 'seconds': 0.0}
+        return stats[name]
+
+    def bwt_stage(self, blocks, stats):
+        """Stufen erhalten und liefern (Zeile der Endmarke, Nutzdaten) je Block"""
+        entry = self.stage_stats(stats, "BWT")
+        for block in blocks:
+            start = time.time()
+            last, primary = self.bwt(block)
+            entry['seconds'] += time.time() - start
+            entry['in_bytes'] += len(block)
+            entry['out_bytes'] += len(last) + 4
+            yield primary, last
+
+    def mtf_stage(self, items, stats):
+        entry = self.stage_stats(stats, "MTF")
+        for primary, data in items:
+            start = time.time()
+            out = self.mtf_encode(data)
+            entry['seconds'] += time.time() - start
+            entry['in_bytes'] += len(data)
+            entry['out_bytes'] += len(out)
+            yield primary, out
+
+    def rle_stage(self, items, stats):
+        entry = self.stage_stats(stats, "RLE")
+        for primary, data in items:
+            start = time.time()
+            out = self.rle_pack(data)
+            entry['seconds'] += time.time() - start
+            entry['in_bytes'] += len(data)
+            entry['out_bytes'] += len(out)
+            yield primary, out
+
+    def huffman_stage(self, items, stats):
+        entry = self.stage_stats(stats, "Huffman")
+        for primary, data in items:
+            start = time.time()
+            out = self.huffman_pack(data)
+            entry['seconds'] += time.time() - start
+            entry['in_bytes'] += len(data)
+            # Tabelle, Bits und 4 Bytes für die Anzahl Bits
+            entry['out_bytes'] += len(out[0]) + len(out[1]) + 4
+            yield primary, out
+
+    def iter_blocks(self, data, block_size):
+        for pos in range(0, len(data), block_size):
+            yield data[pos:pos + block_size]
+
+    def compress(self, data, block_size=1 << 16, stats=None, use_bwt=True):
+        """BWT -> MTF -> RLE -> Huffman, ohne BWT nur RLE -> Huffman"""
+        if stats is None:
+            stats = {}
+        items = self.iter_blocks(data, block_size)
+        if use_bwt:
+            items = self.mtf_stage(self.bwt_stage(items, stats), stats)
+        else:
+            items = ((0, block) for block in items)
+        return list(self.huffman_stage(self.rle_stage(items, stats), stats))
+
+    def decompress(self, items, use_bwt=True):
+        parts = []
+        for primary, (table, packed, n_bits) in items:
+            data = self.rle_unpack(self.huffman_unpack(table, packed, n_bits))
+            if use_bwt:
+                data = self.inverse_bwt(self.mtf_decode(data), primary)
+            parts.append(data)
+        return b"".join(parts)
+
+    def pipeline_report(self, data, block_size=1 << 16):
+        """Bytes, Rate und Durchsatz je Stufe, dazu RLE + Huffman ohne BWT zum Vergleich"""
+        if isinstance(data, str):
+            data = data.encode()
+        stats = {}
+        items = self.compress(data, block_size, stats)
+        if self.decompress(items) != bytes(data):
+            raise ValueError("Dekodierung stimmt nicht!")
+        direct = {}
+        self.compress(data, block_size, direct, use_bwt=False)
+        for entry in list(stats.values()) + list(direct.values()):
+            entry['ratio'] = entry['out_bytes'] / entry['in_bytes'] if entry['in_bytes'] else 0.0
+            entry['mb_per_s'] = entry['in_bytes'] / entry['seconds'] / 1e6 if entry['seconds'] > 0 else 0.0
+        return {
+            'in_bytes': len(data),
+            'stages': [(name, stats[name]) for name in self.STAGES if name in stats],
+            'out_bytes': stats["Huffman"]['out_bytes'] if data else 0,
+            'direct_bytes': direct["Huffman"]['out_bytes'] if data else 0
+        }
+
+    def run(self) -> None:
+        print("=== BWT + MTF + RLE + Huffman ===")
+        try:
+            text = input("Text (leer = Datei): ")
+            if text:
+                data = text.encode()
+            else:
+                with open(input("Datei: ").strip(), "rb") as f:
+                    data = f.read()
+
+            if len(data) <= 64:
+                last, primary = self.bwt(data)
+                print("BWT: '{}' Index {}".format("".join(chr(b) for b in last), primary))
+                print("MTF: {}".format(' '.join(map(str, self.mtf_encode(last)))))
+
+            report = self.pipeline_report(data)
+            print("\nStufe    Ein     Aus     Rate   MB/s")
+            for name, entry in report['stages']:
+                print("{:<8} {:<7} {:<7} {:.3f}  {:.2f}".format(
+                    name, entry['in_bytes'], entry['out_bytes'], entry['ratio'], entry['mb_per_s']))
+            print("\nGesamt: {} -> {} Bytes".format(report['in_bytes'], report['out_bytes']))
+            print("Ohne BWT (RLE + Huffman): {} Bytes".format(report['direct_bytes']))
+
+        except Exception as e:
+            print("FEHLER: {}".format(str(e)))
+
+        print("\nEnter für weiter...")
+        input()
+
+
+class LRUList(object):
+    """Doppelt verkettete Liste von Codes, vorne steht der am längsten unbenutzte"""
+
+    def __init__(self):
+        self.prev = {-1: -1}
+        self.next = {-1: -1}
+
+    def __contains__(self, code):
+        return code in self.next
+
+    def remove(self, code):
+        p = self.prev.pop(code)
+        n = self.next.pop(code)
+        self.next[p] = n
+        self.prev[n] = p
+
+    def insert_after(self, anchor, code):
+        n = self.next[anchor]
+        self.next[anchor] = code
+        self.prev[code] = anchor
+        self.next[code] = n
+        self.prev[n] = code
+
+    def push_front(self, code):
+        self.insert_after(-1, code)
+
+    def push_back(self, code):
+        self.insert_after(self.prev[-1], code)
+
+    def touch(self, code):
+        if code in self.next:
+            self.remove(code)
+            self.push_back(code)
+
+    def oldest(self, exclude=None):
+        code = self.next[-1]
+        if code == exclude:
+            code = self.next[code]
+        return None if code == -1 else code
+
+
 class LZW(Tool):
+    POLICIES = ("freeze", "reset", "lru")
+    FILE_MAGIC = b"LZWN"
 
-    def lzw_encode(self, data, initial_dict=None):
+    def lzw_initial_dictionary(self, data, initial_dict=None):
         """
-        LZW Kompressionsalgorithmus mit optionalem Anfangswörterbuch
+        Anfangswörterbuch {Zeichenfolge: Code} für die Kodierung
         """
-        # Initialisiere Wörterbuch
         if initial_dict is None:
             # Automatisch alle eindeutigen Zeichen aus der Eingabe verwenden
             unique_chars = sorted(set(data))
-            dictionary = {char: i for i, char in enumerate(unique_chars)}
+            return {char: i for i, char in enumerate(unique_chars)}
         elif isinstance(initial_dict, list):
             # Liste von Zeichen -> Dictionary erstellen
-            dictionary = {char: i for i, char in enumerate(initial_dict)}
+            return {char: i for i, char in enumerate(initial_dict)}
         elif isinstance(initial_dict, dict):
             # Dictionary direkt verwenden
-            dictionary = initial_dict.copy()
+            return initial_dict.copy()
         else:
             raise ValueError("initial_dict muss None, Liste oder Dictionary sein")
 
-        result = []
-        current_string = ""
+    def lzw_symbol_values(self, phrase):
+        """
+        Zeichenfolge (str, bytes oder einzelnes Byte als int) als Liste von Ganzzahlen
+        """
+        if isinstance(phrase, int):
+            return [phrase]
+        if isinstance(phrase, str):
+            return [ord(c) for c in phrase]
+        return list(phrase)
 
-        for char in data:
-            # Versuche die Zeichenfolge zu erweitern
-            new_string = current_string + char
+    def lzw_build_trie(self, dictionary):
+        """
+        Baut einen Trie aus dem Wörterbuch. Kinder sind über den Schlüssel
+        (Knoten << 21) | Zeichen erreichbar, Knoten 0 ist die leere Zeichenfolge.
+        Knoten ohne Code (Präfixe von Einträgen, die selbst nicht im Wörterbuch
+        stehen) liegen getrennt in 'pending'.
+        """
+        children = {}
+        pending = {}
+        codes = [dictionary.get("")]
+        parents = [-1]
+        chars = [0]
+        for phrase in dictionary:
+            node = 0
+            for value in self.lzw_symbol_values(phrase):
+                key = (node << 21) | value
+                child = children.get(key)
+                if child is None:
+                    child = pending.get(key)
+                if child is None:
+                    child = len(codes)
+                    pending[key] = child
+                    codes.append(None)
+                    parents.append(node)
+                    chars.append(value)
+                node = child
+            if node:
+                codes[node] = dictionary[phrase]
+                key = (parents[node] << 21) | chars[node]
+                if key in pending:
+                    del pending[key]
+                    children[key] = node
+        return {'children': children, 'pending': pending, 'codes': codes, 'parents': parents,
+                'chars': chars, 'next_code': len(dictionary)}
+
+    def lzw_encode_codes(self, data, trie):
+        """
+        LZW-Kodierung auf dem Trie: pro Eingabezeichen ein Wörterbuchzugriff
+        mit ganzzahligem Schlüssel, der Trie wird dabei erweitert
+        """
+        children = trie['children']
+        pending = trie['pending']
+        codes = trie['codes']
+        parents = trie['parents']
+        chars = trie['chars']
+        next_code = trie['next_code']
+        values = map(ord, data) if isinstance(data, str) else data
 
-            if new_string in dictionary:
+        result = []
+        node = 0
+        for value in values:
+            key = (node << 21) | value
+            child = children.get(key)
+            if child is not None:
                 # Zeichenfolge ist im Wörterbuch, erweitere weiter
-                current_string = new_string
-            else:
-                # Zeichenfolge nicht im Wörterbuch
-                # Gib Index der aktuellen Zeichenfolge aus
-                result.append(dictionary[current_string])
+                node = child
+                continue
 
-                # Füge neue Zeichenfolge zum Wörterbuch hinzu
-                dictionary[new_string] = len(dictionary)
+            code = codes[node]
+            if code is None:
+                if not node:
+                    raise ValueError("Zeichen '{}' nicht im Wörterbuch".format(chr(value)))
+                raise ValueError("Zeichenfolge '{}' nicht im Wörterbuch".format(self.lzw_node_phrase(trie, node)))
+            result.append(code)
 
-                # Beginne mit dem aktuellen Zeichen
-                current_string = char
+            # Füge neue Zeichenfolge zum Wörterbuch hinzu
+            child = pending.pop(key, None) if pending else None
+            if child is None:
+                child = len(codes)
+                codes.append(next_code)
+                parents.append(node)
+                chars.append(value)
+            else:
+                codes[child] = next_code
+            children[key] = child
+            next_code += 1
+
+            # Beginne mit dem aktuellen Zeichen; es muss erst beim Ausgeben einen Code haben
+            node = children.get(value)
+            if node is None:
+                node = pending.get(value)
+            if node is None:
+                node = len(codes)
+                pending[value] = node
+                codes.append(None)
+                parents.append(0)
+                chars.append(value)
 
         # Gib den Index der letzten Zeichenfolge aus
-        if current_string:
-            result.append(dictionary[current_string])
+        if node:
+            if codes[node] is None:
+                raise ValueError("Zeichenfolge '{}' nicht im Wörterbuch".format(self.lzw_node_phrase(trie, node)))
+            result.append(codes[node])
 
-        return result, dictionary
+        trie['next_code'] = next_code
+        return result
 
-    def lzw_decode(self, encoded_data, initial_dict=None):
+    def lzw_node_phrase(self, trie, node):
         """
-        LZW Dekompressionsalgorithmus mit optionalem Anfangswörterbuch
+        Zeichenfolge eines Trie-Knotens, für Fehlermeldungen
+        """
+        chars = []
+        while node > 0:
+            chars.append(chr(trie['chars'][node]))
+            node = trie['parents'][node]
+        return "".join(reversed(chars))
+
+    def lzw_phrases(self, trie, as_bytes=False):
+        """
+        Rekonstruiert {Zeichenfolge: Code} aus dem Trie
+        """
+        codes = trie['codes']
+        parents = trie['parents']
+        chars = trie['chars']
+        phrases = [b"" if as_bytes else ""]
+        dictionary = {phrases[0]: codes[0]} if codes[0] is not None else {}
+        # Eltern haben immer einen kleineren Index als ihre Kinder
+        for node in range(1, len(codes)):
+            char = bytes([chars[node]]) if as_bytes else chr(chars[node])
+            phrases.append(phrases[parents[node]] + char)
+            if codes[node] is not None:
+                dictionary[phrases[node]] = codes[node]
+        return dictionary
+
+    def lzw_encode(self, data, initial_dict=None):
+        """
+        LZW Kompressionsalgorithmus mit optionalem Anfangswörterbuch
+        """
+        trie = self.lzw_build_trie(self.lzw_initial_dictionary(data, initial_dict))
+        result = self.lzw_encode_codes(data, trie)
+        return result, self.lzw_phrases(trie, not isinstance(data, str))
+
+    def lzw_decode_table(self, initial_dict=None):
+        """
+        Anfangstabelle für die Dekodierung, über den Code indexiert.
+        Jeder Eintrag ist (Präfix-Code, letztes Zeichen) mit Länge und erstem
+        Zeichen, Einträge des Anfangswörterbuchs haben Präfix -1 und ihre
+        Zeichen in 'literals'.
         """
-        # Initialisiere Wörterbuch
         if initial_dict is None:
             # Standard: Ziffern 0-9
-            dictionary = {i: str(i) for i in range(10)}
+            entries = {i: str(i) for i in range(10)}
         elif isinstance(initial_dict, list):
             # Liste von Zeichen -> Dictionary erstellen
-            dictionary = {i: char for i, char in enumerate(initial_dict)}
+            entries = {i: char for i, char in enumerate(initial_dict)}
         elif isinstance(initial_dict, dict):
             # Dictionary umkehren (char->index zu index->char)
-            dictionary = {v: k for k, v in initial_dict.items()}
+            entries = {v: k for k, v in initial_dict.items()}
         else:
             raise ValueError("initial_dict muss None, Liste oder Dictionary sein")
 
-        result = ""
+        size = max(entries) + 1 if entries else 0
+        table = {
+            'prefix': [-1] * size,
+            'chars': [None] * size,
+            'firsts': [None] * size,
+            'lengths': [0] * size,
+            'literals': {},
+            'next_code': len(entries)
+        }
+        for code, phrase in entries.items():
+            values = [phrase] if isinstance(phrase, int) else list(phrase)
+            if values:
+                table['chars'][code] = values[-1]
+                table['firsts'][code] = values[0]
+                table['lengths'][code] = len(values)
+                table['literals'][code] = values
+        return table
+
+    def lzw_decode_stream(self, encoded_data, initial_dict=None, chunk_size=4096, as_bytes=False):
+        """
+        LZW-Dekodierung als Generator, liefert Blöcke von höchstens chunk_size
+        Zeichen (oder länger, falls ein einzelner Eintrag länger ist)
+        """
+        table = self.lzw_decode_table(initial_dict)
+        prefix = table['prefix']
+        chars = table['chars']
+        firsts = table['firsts']
+        lengths = table['lengths']
+        literals = table['literals']
+        next_code = table['next_code']
+
+        buf = bytearray(chunk_size) if as_bytes else [""] * chunk_size
+        pos = 0
+        old_code = -1
+
+        for code in encoded_data:
+            if 0 <= code < len(lengths) and lengths[code]:
+                # Code ist im Wörterbuch
+                first = firsts[code]
+            elif code == next_code and old_code >= 0:
+                # Code ist nicht im Wörterbuch (sollte der nächste sein): alt + alt[0]
+                first = firsts[old_code]
+            else:
+                raise ValueError("Ungültiger Code: {}".format(code))
+
+            # Füge neue Zeichenfolge (alt + erstes Zeichen) zum Wörterbuch hinzu
+            if old_code >= 0:
+                if next_code == len(lengths):
+                    prefix.append(old_code)
+                    chars.append(first)
+                    firsts.append(firsts[old_code])
+                    lengths.append(lengths[old_code] + 1)
+                else:
+                    prefix[next_code] = old_code
+                    chars[next_code] = first
+                    firsts[next_code] = firsts[old_code]
+                    lengths[next_code] = lengths[old_code] + 1
+                    literals.pop(next_code, None)
+                next_code += 1
+
+            length = lengths[code]
+            if pos + length > len(buf):
+                if pos:
+                    yield bytes(buf[:pos]) if as_bytes else "".join(buf[:pos])
+                    pos = 0
+                if length > len(buf):
+                    buf = bytearray(length) if as_bytes else [""] * length
+
+            # Zeichenfolge rückwärts über die Präfixkette in den Puffer schreiben
+            i = pos + length - 1
+            c = code
+            while prefix[c] >= 0:
+                buf[i] = chars[c]
+                i -= 1
+                c = prefix[c]
+            for value in reversed(literals[c]):
+                buf[i] = value
+                i -= 1
+            pos += length
+            old_code = code
+
+        if pos:
+            yield bytes(buf[:pos]) if as_bytes else "".join(buf[:pos])
+
+    def lzw_decode(self, encoded_data, initial_dict=None, as_bytes=False):
+        """
+        LZW Dekompressionsalgorithmus mit optionalem Anfangswörterbuch
+        """
+        chunks = self.lzw_decode_stream(encoded_data, initial_dict, as_bytes=as_bytes)
+        return b"".join(chunks) if as_bytes else "".join(chunks)
 
-        if not encoded_data:
-            return result
+    def bit_width(self, value):
+        """
+        Anzahl Bits, um value (>= 0) darzustellen, mindestens 1
+        """
+        width = 1
+        while value >> width:
+            width += 1
+        return width
 
-        # Erstes Symbol
-        old_code = encoded_data[0]
-        result += dictionary[old_code]
+    def lzw_bounded_state(self, alphabet, max_bits, policy, with_children):
+        """
+        Zustand für ein begrenztes Wörterbuch mit 2^max_bits Codes.
+        Codes 0..n-1 sind das Alphabet, bei policy 'reset' ist n der Clear-Code.
+        """
+        if not 9 <= max_bits <= 16:
+            raise ValueError("Codebreite muss zwischen 9 und 16 Bit liegen")
+        if policy not in self.POLICIES:
+            raise ValueError("Unbekannte Strategie: {}".format(policy))
+        base = len(alphabet)
+        first_free = base + 1 if policy == "reset" else base
+        limit = 1 << max_bits
+        if first_free >= limit:
+            raise ValueError("Alphabet zu gross für {} Bit".format(max_bits))
+
+        state = {
+            'policy': policy,
+            'limit': limit,
+            'base': base,
+            'first_free': first_free,
+            'clear_code': base if policy == "reset" else None,
+            'parent': [-1] * limit,
+            'chars': list(alphabet) + [None] * (limit - base),
+            'firsts': list(alphabet) + [None] * (limit - base),
+            'child_count': [0] * limit,
+            'children': {} if with_children else None,
+        }
+        self.lzw_bounded_reset(state)
+        return state
 
-        for i in range(1, len(encoded_data)):
-            new_code = encoded_data[i]
+    def lzw_bounded_reset(self, state):
+        """
+        Setzt das Wörterbuch auf das Alphabet zurück
+        """
+        state['next_code'] = state['first_free']
+        state['lru'] = LRUList() if state['policy'] == "lru" else None
+        child_count = state['child_count']
+        for code in range(state['limit']):
+            child_count[code] = 0
+        if state['children'] is not None:
+            # Schlüssel ((Code + 1) << 21) | Zeichen, die Wurzel hat Code -1
+            state['children'] = {state['chars'][code]: code for code in range(state['base'])}
+
+    def lzw_bounded_slot(self, state, old_code):
+        """
+        Code für den nächsten Eintrag nach old_code oder None, wenn das
+        Wörterbuch voll ist und nichts verdrängt werden kann
+        """
+        code = state['next_code']
+        if code < state['limit']:
+            state['next_code'] = code + 1
+            return code
+        lru = state['lru']
+        if lru is None:
+            return None
+
+        # Am längsten unbenutztes Blatt verdrängen
+        code = lru.oldest(old_code)
+        if code is None:
+            return None
+        lru.remove(code)
+        parent = state['parent'][code]
+        if state['children'] is not None:
+            del state['children'][((parent + 1) << 21) | state['chars'][code]]
+        state['child_count'][parent] -= 1
+        if state['child_count'][parent] == 0 and parent >= state['first_free']:
+            lru.push_front(parent)
+        return code
+
+    def lzw_bounded_link(self, state, code, old_code, char):
+        """
+        Trägt code als old_code + char ein
+        """
+        state['parent'][code] = old_code
+        state['chars'][code] = char
+        state['firsts'][code] = state['firsts'][old_code]
+        state['child_count'][code] = 0
+        if state['children'] is not None:
+            state['children'][((old_code + 1) << 21) | char] = code
+        lru = state['lru']
+        if lru is not None:
+            if state['child_count'][old_code] == 0 and old_code >= state['first_free']:
+                lru.remove(old_code)
+            lru.push_back(code)
+        state['child_count'][old_code] += 1
+
+    def lzw_bounded_alphabet(self, dictionary):
+        """
+        Alphabet (nach Code sortiert) aus einem Anfangswörterbuch mit Codes 0..n-1
+        """
+        alphabet = [None] * len(dictionary)
+        for phrase, code in dictionary.items():
+            if not 0 <= code < len(alphabet) or alphabet[code] is not None:
+                raise ValueError("Codes im Anfangswörterbuch müssen 0..n-1 sein")
+            if not isinstance(phrase, int) and len(phrase) != 1:
+                raise ValueError("Anfangswörterbuch darf nur einzelne Zeichen enthalten")
+            alphabet[code] = phrase
+        return alphabet
+
+    def lzw_bounded_encoder(self, chunks, state, stats):
+        """
+        Kodiert die Blöcke aus chunks (str oder bytes) mit dem begrenzten
+        Wörterbuch in state. Liefert pro Block (Codes, Codebreiten), der letzte
+        Code folgt nach dem letzten Block. Zählt Rücksetzungen und Verdrängungen
+        in stats.
+        """
+        node = -1
+        for chunk in chunks:
+            codes = []
+            widths = []
+            children = state['children']
+            for value in (map(ord, chunk) if isinstance(chunk, str) else chunk):
+                child = children.get(((node + 1) << 21) | value)
+                if child is not None:
+                    node = child
+                    continue
 
-            if new_code in dictionary:
-                # Code ist im Wörterbuch
-                string = dictionary[new_code]
-            else:
-                # Code ist nicht im Wörterbuch (sollte der nächste sein)
-                string = dictionary[old_code] + dictionary[old_code][0]
+                codes.append(node)
+                widths.append(self.bit_width(state['next_code'] - 1))
+                if state['lru'] is not None:
+                    state['lru'].touch(node)
+
+                full = state['next_code'] >= state['limit']
+                slot = self.lzw_bounded_slot(state, node)
+                if slot is not None:
+                    self.lzw_bounded_link(state, slot, node, value)
+                    if full:
+                        stats['evictions'] += 1
+                elif state['policy'] == "reset":
+                    codes.append(state['clear_code'])
+                    widths.append(self.bit_width(state['next_code'] - 1))
+                    self.lzw_bounded_reset(state)
+                    children = state['children']
+                    stats['resets'] += 1
+                if state['next_code'] > stats['peak_entries']:
+                    stats['peak_entries'] = state['next_code']
+
+                node = children.get(value)
+                if node is None:
+                    raise ValueError("Zeichen '{}' nicht im Wörterbuch".format(chr(value)))
+            yield codes, widths
+
+        if node >= 0:
+            yield [node], [self.bit_width(state['next_code'] - 1)]
+
+    def lzw_bounded_next_width(self, state, old_code):
+        """
+        Codebreite des nächsten Codes aus Sicht des Dekodierers
+        """
+        next_code = state['next_code'] if old_code >= 0 else state['next_code'] - 1
+        return self.bit_width(min(next_code, state['limit'] - 1))
 
-            result += string
+    def lzw_bounded_decode_code(self, state, code, old_code):
+        """
+        Dekodiert einen Code (kein Clear-Code) und ergänzt das Wörterbuch,
+        gibt die Zeichen der Zeichenfolge als Liste zurück
+        """
+        firsts = state['firsts']
+        slot = self.lzw_bounded_slot(state, old_code) if old_code >= 0 else None
+        if slot is not None and code == slot:
+            # Code wird gerade erst angelegt: alt + alt[0]
+            first = firsts[old_code]
+        elif 0 <= code < state['next_code'] and code != state['clear_code']:
+            first = firsts[code]
+        else:
+            raise ValueError("Ungültiger Code: {}".format(code))
+        if slot is not None:
+            self.lzw_bounded_link(state, slot, old_code, first)
+
+        parent = state['parent']
+        chars = state['chars']
+        phrase = []
+        c = code
+        while c >= 0:
+            phrase.append(chars[c])
+            c = parent[c]
+        phrase.reverse()
+
+        if state['lru'] is not None:
+            state['lru'].touch(code)
+        return phrase
+
+    def lzw_new_bounded_stats(self, policy, max_bits, state):
+        """
+        Leere Statistik für lzw_bounded_encoder
+        """
+        return {
+            'policy': policy,
+            'max_bits': max_bits,
+            'codes': 0,
+            'bits': 0,
+            'peak_entries': state['next_code'],
+            'resets': 0,
+            'evictions': 0
+        }
 
-            # Füge neue Zeichenfolge zum Wörterbuch hinzu
-            dictionary[len(dictionary)] = dictionary[old_code] + string[0]
+    def lzw_finish_bounded_stats(self, stats, n_symbols, alphabet_size):
+        """
+        Ergänzt Kompressionsrate und Speicherbedarf der Tabelle
+        """
+        symbol_bits = self.bit_width(alphabet_size - 1)
+        stats['ratio'] = stats['bits'] / float(n_symbols * symbol_bits) if n_symbols else 0.0
+        # Tabelle als Präfix-Code (max_bits) + Zeichen (symbol_bits) pro Eintrag
+        stats['peak_bytes'] = (stats['peak_entries'] * (stats['max_bits'] + symbol_bits) + 7) // 8
+        return stats
+
+    def lzw_encode_bounded(self, data, initial_dict=None, max_bits=12, policy="freeze"):
+        """
+        LZW-Kodierung mit höchstens 2^max_bits Codes. Ist das Wörterbuch voll,
+        wird es eingefroren ('freeze'), mit dem Clear-Code zurückgesetzt
+        ('reset') oder das am längsten unbenutzte Blatt verdrängt ('lru').
+        Gibt (Codes, Statistik) zurück.
+        """
+        alphabet = self.lzw_bounded_alphabet(self.lzw_initial_dictionary(data, initial_dict))
+        if isinstance(data, str):
+            values = [ord(c) for c in alphabet]
+        else:
+            values = [c if isinstance(c, int) else c[0] for c in alphabet]
+        state = self.lzw_bounded_state(values, max_bits, policy, True)
+        stats = self.lzw_new_bounded_stats(policy, max_bits, state)
 
-            old_code = new_code
+        result = []
+        for codes, widths in self.lzw_bounded_encoder([data], state, stats):
+            result.extend(codes)
+            stats['bits'] += sum(widths)
+        stats['codes'] = len(result)
+        return result, self.lzw_finish_bounded_stats(stats, len(data), len(alphabet))
 
-        return result
+    def lzw_decode_bounded(self, encoded_data, initial_dict=None, max_bits=12, policy="freeze", as_bytes=False):
+        """
+        Dekodiert die Ausgabe von lzw_encode_bounded mit denselben Parametern
+        """
+        dictionary = self.lzw_initial_dictionary(None, initial_dict) if initial_dict is not None \
+            else {str(i): i for i in range(10)}
+        alphabet = self.lzw_bounded_alphabet(dictionary)
+        if as_bytes:
+            alphabet = [c if isinstance(c, int) else c[0] for c in alphabet]
+        state = self.lzw_bounded_state(alphabet, max_bits, policy, False)
+
+        out = bytearray() if as_bytes else []
+        old_code = -1
+        for code in encoded_data:
+            if code == state['clear_code']:
+                self.lzw_bounded_reset(state)
+                old_code = -1
+                continue
+            out.extend(self.lzw_bounded_decode_code(state, code, old_code))
+            old_code = code
+
+        return bytes(out) if as_bytes else "".join(out)
+
+    def int_to_bytes(self, value, length):
+        """
+        Ganzzahl als Big-Endian-Bytes
+        """
+        out = bytearray(length)
+        for i in range(length - 1, -1, -1):
+            out[i] = value & 0xFF
+            value >>= 8
+        return out
+
+    def bytes_to_int(self, data):
+        """
+        Big-Endian-Bytes als Ganzzahl
+        """
+        value = 0
+        for byte in data:
+            value = (value << 8) | byte
+        return value
+
+    def lzw_compress_file(self, src_path, dst_path, max_bits=12, policy="freeze", alphabet=None,
+                          chunk_size=65536):
+        """
+        Komprimiert eine Datei blockweise. Container: 'LZWN', Version,
+        max_bits, Strategie, Alphabetgrösse (2 Bytes), Alphabet,
+        Originallänge (8 Bytes), danach die Codes bitgepackt (MSB zuerst).
+        """
+        if alphabet is None:
+            alphabet = list(range(256))
+        state = self.lzw_bounded_state(alphabet, max_bits, policy, True)
+        stats = self.lzw_new_bounded_stats(policy, max_bits, state)
+        start = time.time()
+
+        with open(src_path, "rb") as src, open(dst_path, "wb") as dst:
+            src.seek(0, 2)
+            length = src.tell()
+            src.seek(0)
+
+            header = bytearray(self.FILE_MAGIC)
+            header.extend(bytes([1, max_bits, self.POLICIES.index(policy)]))
+            header.extend(self.int_to_bytes(len(alphabet), 2))
+            header.extend(bytes(alphabet))
+            header.extend(self.int_to_bytes(length, 8))
+            dst.write(header)
+            out_bytes = len(header)
+
+            def read_chunks():
+                while True:
+                    chunk = src.read(chunk_size)
+                    if not chunk:
+                        return
+                    yield chunk
+
+            acc = 0
+            n = 0
+            for codes, widths in self.lzw_bounded_encoder(read_chunks(), state, stats):
+                out = bytearray()
+                for code, width in zip(codes, widths):
+                    acc = (acc << width) | code
+                    n += width
+                    if n >= 32:
+                        while n >= 8:
+                            n -= 8
+                            out.append((acc >> n) & 0xFF)
+                        acc &= (1 << n) - 1
+                stats['codes'] += len(codes)
+                stats['bits'] += sum(widths)
+                dst.write(out)
+                out_bytes += len(out)
+
+            out = bytearray()
+            while n >= 8:
+                n -= 8
+                out.append((acc >> n) & 0xFF)
+            if n:
+                out.append((acc << (8 - n)) & 0xFF)
+            dst.write(out)
+            out_bytes += len(out)
+
+        seconds = time.time() - start
+        stats = self.lzw_finish_bounded_stats(stats, length, len(alphabet))
+        stats['in_bytes'] = length
+        stats['out_bytes'] = out_bytes
+        stats['seconds'] = seconds
+        stats['mb_per_s'] = length / 1e6 / seconds if seconds > 0 else 0.0
+        return stats
+
+    def lzw_decompress_file(self, src_path, dst_path, chunk_size=65536):
+        """
+        Entpackt eine mit lzw_compress_file erstellte Datei blockweise,
+        Speicherbedarf: Wörterbuch plus ein Ein- und ein Ausgabeblock
+        """
+        start = time.time()
+        with open(src_path, "rb") as src, open(dst_path, "wb") as dst:
+            header = src.read(9)
+            if len(header) < 9 or header[:4] != self.FILE_MAGIC or header[4] != 1:
+                raise ValueError("Kein LZW-Container")
+            max_bits = header[5]
+            policy = self.POLICIES[header[6]]
+            alphabet = list(src.read(self.bytes_to_int(header[7:9])))
+            length = self.bytes_to_int(src.read(8))
+            state = self.lzw_bounded_state(alphabet, max_bits, policy, False)
+
+            buf = b""
+            pos = 0
+            acc = 0
+            avail = 0
+            remaining = length
+            old_code = -1
+            out = bytearray()
+            while remaining > 0:
+                width = self.lzw_bounded_next_width(state, old_code)
+                while avail < width:
+                    if pos >= len(buf):
+                        buf = src.read(chunk_size)
+                        pos = 0
+                        if not buf:
+                            raise ValueError("Datei unvollständig")
+                    acc = (acc << 8) | buf[pos]
+                    pos += 1
+                    avail += 8
+                avail -= width
+                code = acc >> avail
+                acc &= (1 << avail) - 1
+
+                if code == state['clear_code']:
+                    self.lzw_bounded_reset(state)
+                    old_code = -1
+                    continue
+                phrase = self.lzw_bounded_decode_code(state, code, old_code)
+                out.extend(phrase)
+                remaining -= len(phrase)
+                old_code = code
+                if len(out) >= chunk_size:
+                    dst.write(out)
+                    out = bytearray()
+            dst.write(out)
+
+        seconds = time.time() - start
+        return {
+            'policy': policy,
+            'max_bits': max_bits,
+            'out_bytes': length,
+            'seconds': seconds,
+            'mb_per_s': length / 1e6 / seconds if seconds > 0 else 0.0
+        }
+
+    def lzw_policy_report(self, data, initial_dict=None, max_bits=12):
+        """
+        Statistik aller Strategien für ein begrenztes Wörterbuch
+        """
+        return [self.lzw_encode_bounded(data, initial_dict, max_bits, policy)[1] for policy in self.POLICIES]
 
     def encode_compact(self, data, initial_dict=None):
         """
@@ -403,7 +2777,7 @@ class LZW(Tool):
         Hauptmenü für LZW-Funktionen
         """
         print("=== LZW ===")
-        print("1=Dekodieren 2=Kodieren 0=Exit")
+        print("1=Dekodieren 2=Kodieren 3=Begrenzt 4=Datei 0=Exit")
 
         subchoice = input("Option: ").strip()
 
@@ -481,6 +2855,49 @@ class LZW(Tool):
             except Exception as e:
                 print("FEHLER: {}".format(str(e)))
 
+        elif subchoice == "3":
+            # Begrenztes Wörterbuch: Strategien vergleichen
+            try:
+                data = input("Text zum kodieren: ").strip()
+                if not data:
+                    print("Keine Eingabe!")
+                    return
+
+                initial_dict = self.create_initial_dict_from_input()
+                max_bits = int(input("Max. Codebreite (9-16): ").strip())
+
+                print("Strategie  Codes  Bits  Rate    Einträge  Bytes")
+                for stats in self.lzw_policy_report(data, initial_dict, max_bits):
+                    print("{:<10} {:<6} {:<5} {:<7.4f} {:<9} {}".format(
+                        stats['policy'], stats['codes'], stats['bits'], stats['ratio'],
+                        stats['peak_entries'], stats['peak_bytes']))
+
+            except Exception as e:
+                print("FEHLER: {}".format(str(e)))
+
+        elif subchoice == "4":
+            # Datei komprimieren / entpacken
+            try:
+                print("1=Komprimieren 2=Entpacken")
+                mode = input("Option: ").strip()
+                src_path = input("Quelldatei: ").strip()
+                dst_path = input("Zieldatei: ").strip()
+
+                if mode == "1":
+                    max_bits = int(input("Max. Codebreite (9-16): ").strip())
+                    policy = input("Strategie (freeze/reset/lru): ").strip() or "freeze"
+                    stats = self.lzw_compress_file(src_path, dst_path, max_bits, policy)
+                    print("Original: {} Bytes".format(stats['in_bytes']))
+                    print("Komprimiert: {} Bytes".format(stats['out_bytes']))
+                    print("Rate: {:.4f}".format(stats['ratio']))
+                else:
+                    stats = self.lzw_decompress_file(src_path, dst_path)
+                    print("Entpackt: {} Bytes".format(stats['out_bytes']))
+                print("Zeit: {:.3f} s ({:.2f} MB/s)".format(stats['seconds'], stats['mb_per_s']))
+
+            except Exception as e:
+                print("FEHLER: {}".format(str(e)))
+
         else:
             print("Ungültige Option!")
 
@@ -488,12 +2905,363 @@ class LZW(Tool):
         input()
 
 
+class LZ78(Tool):
+    def lz78_new_state(self, bit_mode=False):
+        """Zustand für die inkrementelle Zerlegung. Bytes/Zeichen: Kinder im Dict unter (Knoten << 21) | Wert
+        wie beim LZW-Trie, Bits: Kinder in einem Array unter 2 * Knoten + Bit"""
+        if bit_mode:
+            children = array('l', [0, 0]) if array is not None else [0, 0]
+        else:
+            children = {}
+        return {'bit_mode': bit_mode, 'children': children, 'nodes': 1, 'node': 0, 'n': 0, 'phrases': 0}
+
+    def lz78_feed(self, state, chunk):
+        """Verarbeitet einen Block: bytes/bytearray (im Bitmodus MSB zuerst) oder str ('0'/'1' bzw. Zeichen)"""
+        children = state['children']
+        nodes = state['nodes']
+        node = state['node']
+        phrases = state['phrases']
+
+        if state['bit_mode']:
+            if isinstance(chunk, str):
+                values = []
+                for ch in chunk:
+                    if ch != "0" and ch != "1":
+                        raise ValueError("Ungültige Bitfolge")
+                    values.append(1 if ch == "1" else 0)
+            else:
+                values = chunk
+            for value in values:
+                if isinstance(chunk, str):
+                    bits = (value,)
+                else:
+                    bits = ((value >> 7) & 1, (value >> 6) & 1, (value >> 5) & 1, (value >> 4) & 1,
+                            (value >> 3) & 1, (value >> 2) & 1, (value >> 1) & 1, value & 1)
+                for bit in bits:
+                    slot = 2 * node + bit
+                    child = children[slot]
+                    if child:
+                        node = child
+                    else:
+                        # neue Phrase = bekannte Phrase + dieses Bit
+                        children[slot] = nodes
+                        children.append(0)
+                        children.append(0)
+                        nodes += 1
+                        phrases += 1
+                        node = 0
+            state['n'] += len(chunk) if isinstance(chunk, str) else 8 * len(chunk)
+        else:
+            for value in chunk:
+                if isinstance(value, str):
+                    value = ord(value)
+                key = (node << 21) | value
+                child = children.get(key)
+                if child is not None:
+                    node = child
+                else:
+                    children[key] = nodes
+                    nodes += 1
+                    phrases += 1
+                    node = 0
+            state['n'] += len(chunk)
+
+        state['nodes'] = nodes
+        state['node'] = node
+        state['phrases'] = phrases
+        return state
+
+    def lz78_result(self, state, alphabet=None):
+        """Phrasenzahl c(n) (angefangene letzte Phrase mitgezählt) und c(n) / (n / log_k(n))"""
+        if alphabet is None:
+            alphabet = 2 if state['bit_mode'] else 256
+        n = state['n']
+        c = state['phrases'] + (1 if state['node'] else 0)
+        normalized = c * math.log(n) / math.log(alphabet) / n if n > 1 else 0.0
+        return {'n': n, 'phrases': c, 'complexity': normalized}
+
+    def lz78_complexity(self, chunks, bit_mode=False, alphabet=None):
+        state = self.lz78_new_state(bit_mode)
+        for chunk in chunks:
+            self.lz78_feed(state, chunk)
+        return self.lz78_result(state, alphabet)
+
+    def lz78_file_complexity(self, path, bit_mode=True, chunk_size=1 << 20):
+        start = time.time()
+        result = self.lz78_complexity(FileEntropyTool().iter_file_chunks(path, chunk_size), bit_mode)
+        result['seconds'] = time.time() - start
+        return result
+
+    def lz78_parse(self, data):
+        """Klassische LZ78-Ausgabe als (Index der Präfixphrase, Zeichen), Index 0 = leer"""
+        index = {"": 0}
+        output = []
+        phrase = ""
+        for ch in data:
+            if phrase + ch in index:
+                phrase += ch
+            else:
+                output.append((index[phrase], ch))
+                index[phrase + ch] = len(index)
+                phrase = ""
+        if phrase:
+            output.append((index[phrase], ""))
+        return output
+
+    def run(self) -> None:
+        print("=== LZ78 / LZ-Komplexität ===")
+        print("1=Text 2=Bitfolge 3=Datei (Bits)")
+        try:
+            mode = input("Option: ").strip()
+            if mode == "3":
+                result = self.lz78_file_complexity(input("Datei: ").strip())
+                print("Zeit: {:.3f} s".format(result['seconds']))
+            else:
+                data = input("Eingabe: ").strip()
+                if len(data) <= 64:
+                    print("Zerlegung:")
+                    for step, (prefix, ch) in enumerate(self.lz78_parse(data), 1):
+                        print("{}. ({}, '{}')".format(step, prefix, ch))
+                alphabet = 2 if mode == "2" else max(2, len(set(data)))
+                result = self.lz78_complexity([data], mode == "2", alphabet)
+
+            print("n = {}".format(result['n']))
+            print("Phrasen c(n) = {}".format(result['phrases']))
+            print("c(n) / (n / log n) = {:.4f}".format(result['complexity']))
+
+        except Exception as e:
+            print("FEHLER: {}".format(str(e)))
+
+        print("\nEnter für weiter...")
+        input()
+
+
+class LZSS(Tool):
+    MIN_MATCH = 3
+
+    def lzss_match_length(self, data, a, b, max_len):
+        """Länge der Übereinstimmung ab a und b, Vergleich in wachsenden Slices"""
+        length = 0
+        step = 4
+        while length < max_len:
+            k = min(step, max_len - length)
+            if data[a + length:a + length + k] == data[b + length:b + length + k]:
+                length += k
+                step <<= 1
+            elif k == 1:
+                break
+            else:
+                step = k >> 1
+        return length
+
+    def lzss_tokens(self, data, window_bits=12, length_bits=4, max_chain=32, lazy=True):
+        """Liefert Literale (int) und Verweise (Distanz, Länge).
+        Suche über Hash-Ketten (Schlüssel: 3 Bytes) mit höchstens max_chain Kandidaten."""
+        if isinstance(data, str):
+            data = data.encode()
+        data = bytes(data)
+        n = len(data)
+        window = 1 << window_bits
+        mask = window - 1
+        min_match = self.MIN_MATCH
+        max_len = min_match + (1 << length_bits) - 1
+        head = {}
+        prev = [-1] * window
+        inserted = 0
+
+        def find(pos):
+            limit = min(max_len, n - pos)
+            best_len = 0
+            best_dist = 0
+            if limit < min_match:
+                return best_len, best_dist
+            cand = head.get(data[pos:pos + min_match], -1)
+            chain = max_chain
+            while cand >= 0 and pos - cand <= window and chain:
+                # schneller Ausschluss über das Byte hinter der bisher besten Länge
+                if best_len < limit and data[cand + best_len] == data[pos + best_len]:
+                    length = self.lzss_match_length(data, cand, pos, limit)
+                    if length > best_len:
+                        best_len = length
+                        best_dist = pos - cand
+                        if length == limit:
+                            break
+                cand = prev[cand & mask]
+                chain -= 1
+            if best_len < min_match:
+                return 0, 0
+            return best_len, best_dist
+
+        pos = 0
+        match = None
+        while pos < n:
+            # alle Positionen vor pos in die Hash-Ketten eintragen
+            while inserted < pos:
+                if inserted + min_match <= n:
+                    key = data[inserted:inserted + min_match]
+                    prev[inserted & mask] = head.get(key, -1)
+                    head[key] = inserted
+                inserted += 1
+
+            length, dist = match if match is not None else find(pos)
+            match = None
+            if not length:
+                yield data[pos]
+                pos += 1
+                continue
+
+            if lazy and length < max_len and pos + 1 < n:
+                # verzögerte Auswertung: ist der Treffer ab pos + 1 länger?
+                if pos + min_match <= n:
+                    key = data[pos:pos + min_match]
+                    prev[pos & mask] = head.get(key, -1)
+                    head[key] = pos
+                inserted = pos + 1
+                following = find(pos + 1)
+                if following[0] > length:
+                    yield data[pos]
+                    pos += 1
+                    match = following
+                    continue
+
+            yield (dist, length)
+            pos += length
+
+    def lzss_pack(self, tokens, window_bits=12, length_bits=4):
+        """Packt Tokens: je ein Flag-Byte für 8 Tokens (Bit = 1: Verweis), Verweise big-endian"""
+        token_bytes = (window_bits + length_bits) // 8
+        if token_bytes * 8 != window_bits + length_bits:
+            raise ValueError("Fensterbits + Längenbits müssen ein Vielfaches von 8 sein")
+        out = bytearray()
+        flag_pos = -1
+        bit = 8
+        for token in tokens:
+            if bit == 8:
+                flag_pos = len(out)
+                out.append(0)
+                bit = 0
+            if isinstance(token, int):
+                out.append(token)
+            else:
+                dist, length = token
+                value = ((dist - 1) << length_bits) | (length - self.MIN_MATCH)
+                for shift in range(8 * (token_bytes - 1), -1, -8):
+                    out.append((value >> shift) & 0xFF)
+                out[flag_pos] |= 1 << bit
+            bit += 1
+        return out
+
+    def lzss_encode(self, data, window_bits=12, length_bits=4, max_chain=32, lazy=True):
+        tokens = self.lzss_tokens(data, window_bits, length_bits, max_chain, lazy)
+        return self.lzss_pack(tokens, window_bits, length_bits)
+
+    def lzss_decode(self, encoded, window_bits=12, length_bits=4):
+        token_bytes = (window_bits + length_bits) // 8
+        length_mask = (1 << length_bits) - 1
+        out = bytearray()
+        pos = 0
+        n = len(encoded)
+        while pos < n:
+            flags = encoded[pos]
+            pos += 1
+            for bit in range(8):
+                if pos >= n:
+                    break
+                if not flags & (1 << bit):
+                    out.append(encoded[pos])
+                    pos += 1
+                    continue
+                value = 0
+                for _ in range(token_bytes):
+                    value = (value << 8) | encoded[pos]
+                    pos += 1
+                dist = (value >> length_bits) + 1
+                length = (value & length_mask) + self.MIN_MATCH
+                start = len(out) - dist
+                if start < 0:
+                    raise ValueError("Ungültige Distanz {}".format(dist))
+                if dist >= length:
+                    out += out[start:start + length]
+                else:
+                    # überlappende Kopie: Muster wiederholen
+                    pattern = out[start:]
+                    out += (pattern * (length // dist + 1))[:length]
+        return bytes(out)
+
+    def show_lzss_steps(self, data, window_bits=12, length_bits=4, max_chain=32, lazy=True):
+        """
+        Zeigt detaillierte Kodierungsschritte (auf Anfrage)
+        """
+        print("\n=== KODIERUNGSSCHRITTE ===")
+        if isinstance(data, str):
+            data = data.encode()
+        tokens = []
+        pos = 0
+        for step, token in enumerate(self.lzss_tokens(data, window_bits, length_bits, max_chain, lazy), 1):
+            if isinstance(token, int):
+                print("{}. Pos {}: Literal '{}'".format(step, pos, chr(token)))
+                pos += 1
+            else:
+                dist, length = token
+                text = bytes(data[pos - dist:pos - dist + length]) if dist >= length else None
+                if text is None:
+                    text = bytes((data[pos - dist:pos] * (length // dist + 1))[:length])
+                print("{}. Pos {}: ({},{}) '{}'".format(step, pos, dist, length, "".join(chr(b) for b in text)))
+                pos += length
+            tokens.append(token)
+        return tokens
+
+    def lzss_report(self, data, window_bits=12, length_bits=4, max_chain=32, lazy=True):
+        if isinstance(data, str):
+            data = data.encode()
+        start = time.time()
+        encoded = self.lzss_encode(data, window_bits, length_bits, max_chain, lazy)
+        seconds = time.time() - start
+        if self.lzss_decode(encoded, window_bits, length_bits) != bytes(data):
+            raise ValueError("Dekodierung stimmt nicht!")
+        return {
+            'in_bytes': len(data),
+            'out_bytes': len(encoded),
+            'ratio': len(encoded) / len(data) if data else 0.0,
+            'seconds': seconds,
+            'mb_per_s': len(data) / seconds / 1e6 if seconds > 0 else 0.0
+        }
+
+    def run(self) -> None:
+        print("=== LZSS ===")
+        try:
+            data = input("Text: ")
+            window_bits = int(input("Fensterbits (leer = 12): ").strip() or "12")
+            length_bits = 16 - window_bits if window_bits < 16 else 8
+            if window_bits > 16:
+                raise ValueError("Fensterbits <= 16")
+            lazy = input("Lazy Matching? (j/n): ").strip().lower() != "n"
+            if input("Schritte anzeigen? (j/n): ").strip().lower() == "j":
+                self.show_lzss_steps(data, window_bits, length_bits, lazy=lazy)
+
+            stats = self.lzss_report(data, window_bits, length_bits, lazy=lazy)
+            print("\nOriginal: {} Bytes".format(stats['in_bytes']))
+            print("Komprimiert: {} Bytes".format(stats['out_bytes']))
+            print("Rate: {:.4f}".format(stats['ratio']))
+
+        except Exception as e:
+            print("FEHLER: {}".format(str(e)))
+
+        print("\nEnter für weiter...")
+        input()
+
+
 class InfoAnalyseTool(Tool):
     def __init__(self):
         self.symbols = []
         self.probs = []
         self.codes = []
         self.results = {}
+        # Abgeleitete Werte, gültig für die Verteilung in cache_key
+        self.cache = {}
+        self.cache_key = None
+        self.cache_hits = 0
+        self.cache_misses = 0
 
     def clear_screen(self):
         """Simuliert clear screen für bessere Übersicht"""
@@ -523,22 +3291,44 @@ class InfoAnalyseTool(Tool):
             if abs(total - 1.0) > 0.001:
                 print("WARNUNG: Summe = {:.3f}".format(total))
 
+            self.invalidate_cache()
             return True
         except Exception as e:
             print("Fehler: {}".format(str(e)))
+            self.invalidate_cache()
             return False
 
+    def invalidate_cache(self):
+        """Verwirft den Cache, falls sich Symbole oder Wahrscheinlichkeiten geändert haben"""
+        key = (tuple(self.symbols), tuple(self.probs))
+        if key != self.cache_key:
+            self.cache = {}
+            self.cache_key = key
+
+    def cached(self, name, compute):
+        """Liefert den gespeicherten Wert name oder berechnet ihn mit compute()"""
+        if name in self.cache:
+            self.cache_hits += 1
+            return self.cache[name]
+        self.cache_misses += 1
+        value = compute()
+        self.cache[name] = value
+        return value
+
+    def cache_stats(self):
+        return {'hits': self.cache_hits, 'misses': self.cache_misses, 'entries': len(self.cache)}
+
     def calculate_all(self):
         """Berechnet alle wichtigen Werte"""
         if not self.probs:
             return False
 
         # Entropie
-        h = -sum(p * math.log(p, 2) for p in self.probs if p > 0)
+        h = self.cached('entropy', lambda: -sum(p * math.log(p, 2) for p in self.probs if p > 0))
 
         # Redundanz Quelle
         n = len(self.symbols)
-        h0 = math.log(n, 2)
+        h0 = self.cached('h0', lambda: math.log(n, 2))
         rq = h0 - h
 
         # Speichere Ergebnisse
@@ -552,37 +3342,17 @@ class InfoAnalyseTool(Tool):
         return True
 
     def create_huffman(self):
-        """Erstellt Huffman-Code"""
-        if len(self.symbols) <= 1:
-            return {"codes": {self.symbols[0]: "0"}, "avg_len": 1.0}
-
-        # Nodes: [freq, symbol_or_list]
-        nodes = [[p, s] for s, p in zip(self.symbols, self.probs)]
-
-        while len(nodes) > 1:
-            nodes.sort(key=lambda x: x[0])
-            left = nodes.pop(0)
-            right = nodes.pop(0)
-
-            merged = [left[0] + right[0], [left, right]]
-            nodes.append(merged)
-
-        # Codes extrahieren
-        codes = {}
+        """Erstellt Huffman-Code (einmal pro Verteilung)"""
+        return self.cached('huffman', self.build_huffman)
 
-        def assign_codes(node, code=""):
-            if isinstance(node[1], str):  # Blatt
-                codes[node[1]] = code if code else "0"
-            else:  # Innerer Knoten
-                assign_codes(node[1][0], code + "0")
-                assign_codes(node[1][1], code + "1")
-
-        assign_codes(nodes[0])
+    def build_huffman(self):
+        tool = HuffmanTool()
+        codes = dict(tool.huffman_coding(self.symbols, self.probs))
 
         # Mittlere Länge
         avg_len = sum(len(codes[s]) * p for s, p in zip(self.symbols, self.probs))
 
-        return {"codes": codes, "avg_len": avg_len}
+        return {"codes": codes, "avg_len": avg_len, "decode": tool.decode_tables(codes)}
 
     def show_summary(self):
         """Zeigt Zusammenfassung"""
@@ -647,15 +3417,15 @@ class InfoAnalyseTool(Tool):
 
         msg = input("Nachricht: ")
         huff = self.create_huffman()
+        tool = HuffmanTool()
 
-        encoded = ""
-        for char in msg:
-            if char in huff['codes']:
-                encoded += huff['codes'][char]
-            else:
-                print("Zeichen '{}' unbekannt!".format(char))
-                return
+        try:
+            packed, n_bits = tool.encode_bits(msg, huff['codes'])
+        except ValueError as e:
+            print(str(e))
+            return
 
+        encoded = tool.bits_to_string(packed, n_bits)
         print("Codiert: {}".format(encoded))
         print("Länge: {} bit".format(len(encoded)))
         orig_len = len(msg) * math.ceil(math.log(len(self.symbols), 2))
@@ -664,6 +3434,29 @@ class InfoAnalyseTool(Tool):
             comp = len(encoded) / float(orig_len)
             print("Kompression: {:.1%}".format(comp))
 
+        if "".join(tool.decode_bits(packed, n_bits, huff['codes'], tables=huff['decode'])) != msg:
+            print("WARNUNG: Dekodierung stimmt nicht!")
+
+    def decode_message(self):
+        """Bitfolge decodieren"""
+        if not self.symbols:
+            print("Keine Daten!")
+            return
+
+        bit_str = input("Bitfolge: ").strip().replace(" ", "")
+        huff = self.create_huffman()
+        tool = HuffmanTool()
+
+        try:
+            packed, n_bits = tool.string_to_bits(bit_str)
+            decoded = tool.decode_bits(packed, n_bits, huff['codes'], tables=huff['decode'])
+        except ValueError as e:
+            print("Fehler: {}".format(str(e)))
+            return
+
+        print("Decodiert: {}".format("".join(decoded)))
+        print("Symbole: {}".format(len(decoded)))
+
     def run(self):
         """Hauptmenü"""
         while True:
@@ -678,6 +3471,7 @@ class InfoAnalyseTool(Tool):
                 print("4) Huffman Details")
                 print("5) Nachricht codieren")
                 print("6) Neue Daten")
+                print("7) Bitfolge decodieren")
             else:
                 print("Keine Daten vorhanden")
                 print("")
@@ -708,6 +3502,8 @@ class InfoAnalyseTool(Tool):
             elif choice == '6' and self.symbols:
                 if self.input_data():
                     self.calculate_all()
+            elif choice == '7' and self.symbols:
+                self.decode_message()
             else:
                 print("Ungültige Eingabe!")
 